@@ -1,4 +1,5 @@
 from typing import Dict, List, Optional, Tuple, Union
+import math
 import time
 
 import numpy as np
@@ -25,6 +26,9 @@ try:
 except Exception:
     torch = None
 
+# For a rotation about basis axis k, the (i, j) plane it rotates in.
+_AXIS_PLANES = ((1, 2), (2, 0), (0, 1))
+
 
 class KinematicsSolver:
     """Forward and Inverse Kinematics Solver."""
@@ -311,6 +315,22 @@ class KinematicsSolver:
 
     @staticmethod
     def _joint_motion_matrix(joint_type: str, axis: np.ndarray, q: float) -> np.ndarray:
+        # URDF axes are almost always +/- x, y or z; fill those matrices directly.
+        nonzero = np.flatnonzero(axis)
+        if nonzero.size == 1 and joint_type in ("revolute", "continuous", "prismatic"):
+            k = int(nonzero[0])
+            mat = np.eye(4)
+            if joint_type == "prismatic":
+                mat[k, 3] = axis[k] * q
+                return mat
+            angle = float(q) if axis[k] > 0 else -float(q)
+            c, s = math.cos(angle), math.sin(angle)
+            i, j = _AXIS_PLANES[k]
+            mat[i, i] = c
+            mat[i, j] = -s
+            mat[j, i] = s
+            mat[j, j] = c
+            return mat
         if joint_type in ("revolute", "continuous"):
             axis = axis / (np.linalg.norm(axis) + 1e-8)
             rot = Rotation.from_rotvec(axis * q).as_matrix()
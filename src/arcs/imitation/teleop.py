@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Optional, Dict, Any
 import numpy as np
 import time
@@ -61,7 +61,8 @@ class TeleoperationInterface:
         actions = []
         rewards = []
 
-        observations.append(obs)
+        # Envs may reuse their observation buffers between steps; keep copies.
+        observations.append(replace(obs, proprio=np.copy(obs.proprio)))
 
         for t in range(max_steps):
             action = self.read_input()
@@ -71,7 +72,7 @@ class TeleoperationInterface:
 
             actions.append(action)
             rewards.append(reward)
-            observations.append(next_obs)
+            observations.append(replace(next_obs, proprio=np.copy(next_obs.proprio)))
 
             obs = next_obs
 
@@ -1,11 +1,31 @@
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 import numpy as np
 import torch
 
 from arcs.utils.logging import log_event, new_correlation_id
 
+try:
+    import numba
+except Exception:
+    numba = None
+
+
+def _gae_scan(
+    deltas: np.ndarray, next_non_terminal: np.ndarray, discount: float, out: np.ndarray
+) -> np.ndarray:
+    # Reverse GAE recursion; next_non_terminal[t] == 0 cuts the sum at episode ends.
+    gae = 0.0
+    for t in range(deltas.shape[0] - 1, -1, -1):
+        gae = deltas[t] + discount * next_non_terminal[t] * gae
+        out[t] = gae
+    return out
+
+
+if numba is not None:
+    _gae_scan = numba.njit(cache=True, fastmath=True)(_gae_scan)
+
 
 class BufferNotFullError(RuntimeError):
     pass
@@ -61,6 +81,18 @@ class RolloutBuffer:
         self._last_done = True
         self._full_emitted = False
         self._normalized_advantages = None
+        self._lane_step = 0
+        self._num_lanes = 0
+        self._lane_last_done: Optional[np.ndarray] = None
+
+        if numba is not None:
+            # Trigger (or load the cached) JIT compilation outside the rollout loop.
+            _gae_scan(
+                np.zeros(1, dtype=np.float32),
+                np.zeros(1, dtype=np.float32),
+                0.0,
+                np.empty(1, dtype=np.float32),
+            )
 
     @property
     def size(self) -> int:
@@ -126,14 +158,163 @@ class RolloutBuffer:
                 )
                 self._full_emitted = True
 
+    def add_batch(
+        self,
+        obs,
+        actions,
+        rewards,
+        dones,
+        values,
+        log_probs,
+        episode_starts: Optional[np.ndarray] = None,
+    ) -> None:
+        """Append n transitions at once; equivalent to n calls to add()."""
+        obs = np.asarray(obs, dtype=np.float32)
+        n = obs.shape[0]
+        if n == 0:
+            return
+        if not self.allow_overwrite and self.ptr + n > self.max_size:
+            log_event(
+                "buffer.overflow",
+                self.correlation_id,
+                size=self.size,
+                max_size=self.max_size,
+            )
+            if self.raise_on_overflow:
+                raise BufferOverflowError("RolloutBuffer overflow")
+            n = self.max_size - self.ptr
+            if n <= 0:
+                return
+
+        rewards = np.nan_to_num(np.asarray(rewards, dtype=np.float32)[:n], nan=0.0)
+        rewards = np.clip(rewards, -self.reward_clip, self.reward_clip)
+        dones = np.asarray(dones, dtype=np.float32)[:n]
+        if episode_starts is None:
+            starts = np.empty(n, dtype=bool)
+            starts[0] = self._last_done
+            starts[1:] = dones[:-1] != 0
+        else:
+            starts = np.asarray(episode_starts, dtype=bool)[:n]
+
+        columns = (
+            (self.obs, obs[:n]),
+            (self.actions, np.asarray(actions, dtype=np.float32)[:n]),
+            (self.rewards, rewards),
+            (self.dones, dones),
+            (self.values, np.asarray(values, dtype=np.float32)[:n]),
+            (self.log_probs, np.asarray(log_probs, dtype=np.float32)[:n]),
+            (self.episode_starts, starts),
+        )
+        start = self.ptr % self.max_size
+        if start + n <= self.max_size:
+            for dest, src in columns:
+                np.copyto(dest[start : start + n], src)
+        else:
+            # Overwrite mode wrapping past the end; later rows win on repeats.
+            keep = min(n, self.max_size)
+            idx = (start + np.arange(n - keep, n)) % self.max_size
+            for dest, src in columns:
+                dest[idx] = src[n - keep :]
+        self._last_done = bool(dones[-1])
+
+        self.ptr += n
+        if self.ptr >= self.max_size:
+            self.full = True
+            if self.allow_overwrite:
+                self.ptr %= self.max_size
+            else:
+                self.ptr = self.max_size
+            if not self._full_emitted:
+                log_event(
+                    "buffer.full",
+                    self.correlation_id,
+                    size=self.size,
+                    max_size=self.max_size,
+                )
+                self._full_emitted = True
+
+    def add_vectorized(self, obs, actions, rewards, dones, values, log_probs) -> None:
+        """
+        Append one step from n parallel envs. The buffer is split into n lanes of
+        buffer_size // n rows and env i fills lane i in order, so GAE sees each
+        env's trajectory contiguously; read the buffer once it is full. With
+        allow_overwrite, each lane wraps and overwrites its own oldest row.
+        Inputs have a leading env axis; CPU tensors are accepted as-is.
+        """
+        obs = np.asarray(obs, dtype=np.float32)
+        n = obs.shape[0]
+        if self.max_size % n:
+            raise ValueError("buffer_size must be divisible by the number of envs")
+        if self.ptr % n or (self._lane_step == 0 and self.ptr):
+            raise ValueError(
+                "add_vectorized needs a lane-aligned buffer; reset() it after add()/add_batch()"
+            )
+        lane_len = self.max_size // n
+        step = self._lane_step
+        if step >= lane_len and not self.allow_overwrite:
+            log_event(
+                "buffer.overflow",
+                self.correlation_id,
+                size=self.size,
+                max_size=self.max_size,
+            )
+            if self.raise_on_overflow:
+                raise BufferOverflowError("RolloutBuffer overflow")
+            return
+
+        rewards = np.nan_to_num(np.asarray(rewards, dtype=np.float32), nan=0.0)
+        dones = np.asarray(dones, dtype=np.float32)
+        # Row `step % lane_len` of every lane: a strided view, one row per env.
+        rows = slice(step % lane_len, self.max_size, lane_len)
+        self.obs[rows] = obs
+        self.actions[rows] = np.asarray(actions, dtype=np.float32)
+        self.rewards[rows] = np.clip(rewards, -self.reward_clip, self.reward_clip)
+        self.dones[rows] = dones
+        self.values[rows] = np.asarray(values, dtype=np.float32)
+        self.log_probs[rows] = np.asarray(log_probs, dtype=np.float32)
+        # Each lane opens a new segment so GAE never bootstraps across lanes.
+        self.episode_starts[rows] = True if step == 0 else self._lane_last_done
+        self._lane_last_done = dones != 0
+
+        self._num_lanes = n
+        self._lane_step = step + 1
+        self.ptr = self._lane_step * n
+        if self._lane_step >= lane_len:
+            self.full = True
+            if self.allow_overwrite:
+                self.ptr = (self._lane_step % lane_len) * n
+            else:
+                self.ptr = self.max_size
+            if not self._full_emitted:
+                log_event(
+                    "buffer.full",
+                    self.correlation_id,
+                    size=self.size,
+                    max_size=self.max_size,
+                )
+                self._full_emitted = True
+
     def compute_returns_and_advantage(
         self,
-        last_value: float,
+        last_value: Union[float, np.ndarray],
         episode_starts: Optional[np.ndarray] = None,
         normalize_advantages: Optional[bool] = None,
     ) -> None:
+        """
+        last_value is the value estimate of the state after the last stored step.
+        For a full add_vectorized buffer it may hold one entry per lane (a scalar
+        applies to every lane): each lane's last row bootstraps from its own entry
+        unless that step ended an episode, and GAE still never carries across lanes.
+        """
         if self.size == 0:
             return
+        lanes = self._num_lanes if self._num_lanes and self.full else 0
+        last_values = np.asarray(last_value, dtype=np.float32).reshape(-1)
+        if last_values.size != 1 and last_values.size != lanes:
+            raise ValueError(
+                "last_value must be a scalar or hold one value per lane of a full "
+                "add_vectorized buffer"
+            )
 
         start_time = time.perf_counter()
         indices = self._ordered_indices()
@@ -149,25 +330,49 @@ class RolloutBuffer:
 
         if episode_starts_t.numel() > 0:
             episode_starts_t[0] = True
+        if episode_starts is None and lanes:
+            # Lanes are separate trajectories; a wrapped lane's oldest row may
+            # not carry its start flag.
+            episode_starts_t[:: self.max_size // lanes] = True
 
-        next_values = torch.cat([values[1:], torch.tensor([last_value])])
+        next_values = torch.cat([values[1:], torch.from_numpy(last_values[-1:])])
         next_non_terminal = 1.0 - dones
         if episode_starts_t.numel() > 1:
             next_non_terminal[:-1] = 1.0 - episode_starts_t[1:].float()
+        bootstrap = next_non_terminal
+        if lanes:
+            # A lane's last row is followed by the next lane's first row, so the GAE
+            # carry (next_non_terminal) stays cut there; only the one-step bootstrap
+            # uses the lane's own next value, unless its last step ended an episode.
+            lane_len = self.max_size // lanes
+            lane_ends = torch.arange(lane_len - 1, self.max_size, lane_len)
+            next_values[lane_ends] = torch.from_numpy(np.resize(last_values, lanes))
+            bootstrap = next_non_terminal.clone()
+            bootstrap[lane_ends] = 1.0 - dones[lane_ends]
+
+        deltas = rewards + self.gamma * next_values * bootstrap - values
 
-        deltas = rewards + self.gamma * next_values * next_non_terminal - values
-
-        advantages = torch.zeros_like(deltas)
         discount = self.gamma * self.gae_lambda
-        starts = torch.nonzero(episode_starts_t, as_tuple=False).flatten().tolist()
-        if len(starts) == 0:
-            starts = [0]
-        ends = starts[1:] + [len(deltas)]
-        for start, end in zip(starts, ends):
-            segment = deltas[start:end]
-            if segment.numel() == 0:
-                continue
-            advantages[start:end] = self._discounted_cumsum(segment, discount)
+        if numba is not None:
+            advantages = torch.from_numpy(
+                _gae_scan(
+                    deltas.numpy(),
+                    next_non_terminal.numpy(),
+                    discount,
+                    np.empty(deltas.shape[0], dtype=np.float32),
+                )
+            )
+        else:
+            advantages = torch.zeros_like(deltas)
+            starts = torch.nonzero(episode_starts_t, as_tuple=False).flatten().tolist()
+            if len(starts) == 0:
+                starts = [0]
+            ends = starts[1:] + [len(deltas)]
+            for start, end in zip(starts, ends):
+                segment = deltas[start:end]
+                if segment.numel() == 0:
+                    continue
+                advantages[start:end] = self._discounted_cumsum(segment, discount)
 
         returns = advantages + values
 
@@ -280,6 +485,11 @@ class RolloutBuffer:
     def _ordered_indices(self) -> np.ndarray:
         if not self.full or not self.allow_overwrite:
             return np.arange(self.size)
+        if self._num_lanes:
+            # Each wrapped lane, oldest row first.
+            lane_len = self.max_size // self._num_lanes
+            offsets = (self._lane_step + np.arange(lane_len)) % lane_len
+            return (np.arange(self._num_lanes)[:, None] * lane_len + offsets).ravel()
         return np.concatenate(
             (np.arange(self.ptr, self.max_size), np.arange(0, self.ptr))
         )
@@ -287,6 +497,9 @@ class RolloutBuffer:
     def reset(self) -> None:
         self.ptr = 0
         self.full = False
+        self._lane_step = 0
+        self._num_lanes = 0
+        self._lane_last_done = None
         self._sample_indices = None
         self._sample_pos = 0
         self._last_done = True
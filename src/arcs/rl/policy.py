@@ -52,3 +52,9 @@ class MLPPolicy(nn.Module):
         value = self.critic(obs).squeeze(-1)
 
         return action, log_prob, entropy, value
+
+    def act_deterministic(self, obs):
+        """Mean action only: no sampling, log-prob or value head (for evaluation)."""
+        if not isinstance(obs, torch.Tensor):
+            obs = torch.tensor(obs, dtype=torch.float32)
+        return self.actor_mean(obs)
@@ -43,17 +43,19 @@ class SafetyFilter:
         self.use_qp = use_qp
         self.solver_timeout = solver_timeout
         self.correlation_id = new_correlation_id()
+        # float32 constants keep float32 actions from being upcast on the hot path.
+        self._dt = np.float32(dt)
+        self._inv_dt = np.float32(1.0 / dt)
 
     def filter_action(self, action: np.ndarray, current_state: Dict) -> np.ndarray:
         start_time = time.perf_counter()
         action = np.asarray(action, dtype=np.float32)
-        if np.any(np.isnan(action)):
-            safe_action = np.zeros_like(action)
-            self._log_event(action, safe_action, [], 0, 0.0)
-            return safe_action
-
         q = np.asarray(current_state.get("joint_pos", np.zeros_like(action)), dtype=np.float32)
-        if np.any(np.isnan(q)):
+        # A finite sum proves there is no NaN, so the common case costs one reduction
+        # per array. Infinities or overflow also make the sum non-finite; only then
+        # fall back to the explicit isnan check so those inputs still get clipped.
+        total = float(action.sum(dtype=np.float64)) + float(q.sum(dtype=np.float64))
+        if not np.isfinite(total) and (np.isnan(action).any() or np.isnan(q).any()):
             safe_action = np.zeros_like(action)
             self._log_event(action, safe_action, [], 0, 0.0)
             return safe_action
@@ -83,7 +85,7 @@ class SafetyFilter:
 
         pos_min = np.asarray(self.joint_limits.pos_min, dtype=np.float32)
         pos_max = np.asarray(self.joint_limits.pos_max, dtype=np.float32)
-        q_next = q + u * self.dt
+        q_next = q + u * self._dt
         constraints += [q_next >= pos_min, q_next <= pos_max]
 
         if self.workspace_bounds is not None:
@@ -92,7 +94,7 @@ class SafetyFilter:
             if ee_pos is not None and jacobian is not None:
                 ee_pos = np.asarray(ee_pos, dtype=np.float32)
                 jacobian = np.asarray(jacobian, dtype=np.float32)
-                ee_next = ee_pos + jacobian[:3, :] @ u * self.dt
+                ee_next = ee_pos + jacobian[:3, :] @ u * self._dt
                 constraints += [
                     ee_next >= self.workspace_bounds.lower,
                     ee_next <= self.workspace_bounds.upper,
@@ -123,10 +125,10 @@ class SafetyFilter:
 
         safe = np.clip(action, -vel_max, vel_max)
         safe = np.clip(safe, -torque_max, torque_max)
-        q_next = q + safe * self.dt
+        q_next = q + safe * self._dt
         q_next = np.clip(q_next, pos_min, pos_max)
-        safe = (q_next - q) / self.dt
-        return safe.astype(np.float32), 0
+        safe = (q_next - q) * self._inv_dt
+        return safe.astype(np.float32, copy=False), 0
 
     def _log_event(
         self,
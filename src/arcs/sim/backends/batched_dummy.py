@@ -0,0 +1,190 @@
+import numpy as np
+import gymnasium as gym
+from typing import Dict, List, Optional, Tuple
+
+from arcs.sim.interfaces import SimulationEnv, Observation, State
+from arcs.sim.backends.dummy import DT, MAX_EPISODE_STEPS, SNAPSHOT_SIZE
+
+
+class BatchedDummyBackend(SimulationEnv):
+    """
+    Structure-of-arrays variant of DummyBackend that steps all envs at once.
+    State is held as (num_envs, ...) arrays and the dynamics run as one set of
+    numpy ufuncs, so there is no per-env Python call and no stacking copy.
+
+    Each lane draws its dropout/noise streams from its own generator, and
+    reset(seed) seeds lane i with seed + i (as VectorizedEnv does), so lane i
+    reproduces a DummyBackend reset with seed + i.
+
+    It sets `supports_batched`, so the factory routes num_envs > 1 through
+    VectorizedEnv, which holds one instance and forwards every call to it.
+
+    The returned observation's proprio is a view of an internal buffer that the
+    next reset/step overwrites; copy it if it must outlive the step.
+    """
+
+    supports_batched = True
+
+    def __init__(
+        self,
+        task_name: str = "Reach",
+        num_envs: int = 1,
+        device: str = "cpu",
+        config: Optional[object] = None,
+    ):
+        if num_envs < 1:
+            raise ValueError("num_envs must be >= 1")
+        self.task_name = task_name
+        self.num_envs = num_envs
+        self.device = device
+        self.config = config
+        self.timestep = 0
+        self._action_space = gym.spaces.Box(
+            low=-1.0, high=1.0, shape=(num_envs, 7), dtype=np.float32
+        )
+        self._observation_space = gym.spaces.Box(
+            low=-np.inf, high=np.inf, shape=(num_envs, 20), dtype=np.float32
+        )
+
+        # Internal state
+        self.joint_pos: np.ndarray = np.zeros((num_envs, 7))
+        self.joint_vel: np.ndarray = np.zeros((num_envs, 7))
+        self.object_pos: np.ndarray = np.tile(np.array([0.5, 0.0, 0.5]), (num_envs, 1))
+        self._obs_buf: np.ndarray = np.zeros((num_envs, 20), dtype=np.float32)
+        self._ee_err: np.ndarray = np.empty((num_envs, 3))
+
+        # Parameter stores
+        self._dynamics_params: Dict[str, float] = {}
+        self._sensor_params: Dict[str, float] = {}
+        self._action_params: Dict[str, float] = {}
+
+        self._rngs: List[np.random.Generator] = [np.random.default_rng() for _ in range(num_envs)]
+        self._dropout_mask: Optional[np.ndarray] = None
+        self._noise_stream: Optional[np.ndarray] = None
+
+    def reset(self, seed: Optional[int] = None) -> Observation:
+        if seed is not None:
+            self._rngs = [np.random.default_rng(seed + idx) for idx in range(self.num_envs)]
+
+        self.timestep = 0
+        self.joint_pos.fill(0.0)
+        self.joint_vel.fill(0.0)
+        self._resample_dropout()
+        self._resample_noise()
+
+        return self._get_obs()
+
+    def step(
+        self, action: np.ndarray
+    ) -> Tuple[Observation, np.ndarray, np.ndarray, np.ndarray, Dict]:
+        self.timestep += 1
+
+        mask = self._dropout_mask
+        if mask is not None and self.timestep < mask.shape[1]:
+            # Dropped envs repeat their last action
+            action = np.where(mask[:, self.timestep, None], self.joint_vel, action)
+
+        np.copyto(self.joint_vel, action)
+        self.joint_pos += self.joint_vel * 0.05  # dt = 0.05
+        np.clip(self.joint_pos, -np.pi, np.pi, out=self.joint_pos)
+
+        obs = self._get_obs()
+        np.subtract(self.joint_pos[:, :3], self.object_pos, out=self._ee_err)
+        reward = -np.sqrt(np.einsum("ij,ij->i", self._ee_err, self._ee_err))
+
+        terminated = np.zeros(self.num_envs, dtype=bool)
+        truncated = np.full(self.num_envs, self.timestep > MAX_EPISODE_STEPS)
+        info = {"per_env": [{"is_success": False} for _ in range(self.num_envs)]}
+
+        return obs, reward.astype(np.float32), terminated, truncated, info
+
+    def get_state(self) -> State:
+        return State(
+            joint_pos=self.joint_pos.copy(),
+            joint_vel=self.joint_vel.copy(),
+            object_states={"target": self.object_pos.copy()},
+            timestamp=self.timestep * DT,
+        )
+
+    def set_state(self, state: State) -> None:
+        self.joint_pos[...] = state.joint_pos
+        self.joint_vel[...] = state.joint_vel
+        if "target" in state.object_states:
+            self.object_pos[...] = state.object_states["target"]
+        self.timestep = int(round(state.timestamp / DT))
+
+    def snapshot(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if out is None:
+            out = np.empty((self.num_envs, SNAPSHOT_SIZE), dtype=self.joint_pos.dtype)
+        out[:, 0:7] = self.joint_pos
+        out[:, 7:14] = self.joint_vel
+        out[:, 14:17] = self.object_pos
+        out[:, 17] = self.timestep * DT
+        return out
+
+    def restore(self, buf: np.ndarray) -> None:
+        self.joint_pos[...] = buf[:, 0:7]
+        self.joint_vel[...] = buf[:, 7:14]
+        self.object_pos[...] = buf[:, 14:17]
+        self.timestep = int(round(buf[0, 17] / DT))
+
+    @property
+    def action_space(self) -> gym.Space:
+        return self._action_space
+
+    @property
+    def observation_space(self) -> gym.Space:
+        return self._observation_space
+
+    def _get_obs(self) -> Observation:
+        proprio = self._obs_buf
+        proprio[:, 0:7] = self.joint_pos
+        proprio[:, 7:14] = self.joint_vel
+
+        noise = self._noise_stream
+        if noise is not None:
+            if self.timestep < noise.shape[1]:
+                proprio[:, 0:14] += noise[:, self.timestep]
+            else:
+                noise_scale = self._sensor_params["noise_scale"]
+                for row, rng in zip(proprio, self._rngs):
+                    row[0:14] += rng.normal(0, noise_scale, size=14)
+
+        return Observation(proprio=proprio, timestep=self.timestep)
+
+    def close(self):
+        pass
+
+    def update_dynamics(self, params: Dict[str, float]) -> None:
+        self._dynamics_params = params
+
+    def update_sensors(self, params: Dict[str, float]) -> None:
+        changed = params.get("noise_scale", 0.0) != self._sensor_params.get("noise_scale", 0.0)
+        self._sensor_params = params
+        if changed:
+            self._resample_noise()
+
+    def update_action(self, params: Dict[str, float]) -> None:
+        changed = params.get("dropout", 0.0) != self._action_params.get("dropout", 0.0)
+        self._action_params = params
+        if changed:
+            self._resample_dropout()
+
+    def _resample_dropout(self) -> None:
+        dropout = self._action_params.get("dropout", 0.0)
+        if dropout > 0:
+            self._dropout_mask = (
+                np.stack([rng.random(MAX_EPISODE_STEPS + 2) for rng in self._rngs]) < dropout
+            )
+        else:
+            self._dropout_mask = None
+
+    def _resample_noise(self) -> None:
+        noise_scale = self._sensor_params.get("noise_scale", 0.0)
+        if noise_scale > 0:
+            self._noise_stream = np.stack(
+                [rng.standard_normal((MAX_EPISODE_STEPS + 2, 14)) for rng in self._rngs]
+            )
+            self._noise_stream *= noise_scale
+        else:
+            self._noise_stream = None
@@ -4,6 +4,16 @@ from typing import Dict, Optional, Tuple, Any
 
 from arcs.sim.interfaces import SimulationEnv, Observation, State
 
+# Episodes truncate once timestep exceeds this; per-episode streams cover every index.
+MAX_EPISODE_STEPS = 100
+
+# Simulated seconds per step; State.timestamp is timestep * DT.
+DT = 0.01
+
+# snapshot() layout matches SimulationEnv.snapshot:
+# joint_pos(7), joint_vel(7), object_states["target"](3), timestamp(1)
+SNAPSHOT_SIZE = 18
+
 
 class DummyBackend(SimulationEnv):
     """
@@ -38,29 +48,34 @@ class DummyBackend(SimulationEnv):
         self._sensor_params = {}
         self._action_params = {}
 
+        # Per-episode precomputed randomness (see _resample_dropout/_resample_noise)
+        self._rng = np.random.default_rng()
+        self._dropout_mask: Optional[np.ndarray] = None
+        self._noise_stream: Optional[np.ndarray] = None
+
     def reset(self, seed: Optional[int] = None) -> Observation:
         if seed is not None:
             np.random.seed(seed)
+            self._rng = np.random.default_rng(seed)
 
         self.timestep = 0
         self.joint_pos = np.zeros(7)
         self.joint_vel = np.zeros(7)
+        self._resample_dropout()
+        self._resample_noise()
 
         return self._get_obs()
 
     def step(self, action: np.ndarray) -> Tuple[Observation, float, bool, bool, Dict]:
         self.timestep += 1
 
-        # Apple action noise/latency if configured
-        if self._action_params:
-            if np.random.random() < self._action_params.get("dropout", 0.0):
-                action = self.joint_vel  # Repeat last action
-
-            _latency = self._action_params.get("latency", 0.0)
-            # Simple latency simulation could go here (queue), skipping for now due to state complexity
+        # Apply action dropout from the mask drawn at reset
+        mask = self._dropout_mask
+        if mask is not None and self.timestep < mask.shape[0] and mask[self.timestep]:
+            action = self.joint_vel  # Repeat last action
 
         # Simple integrator dynamics
-        self.joint_vel = action  # Velocity control
+        np.copyto(self.joint_vel, action)  # Velocity control
         self.joint_pos += self.joint_vel * 0.05  # dt = 0.05
 
         # Enforce joint limits ([-pi, pi])
@@ -70,7 +85,7 @@ class DummyBackend(SimulationEnv):
         reward = -np.linalg.norm(self.joint_pos[:3] - self.object_pos)  # Simple reach reward
 
         terminated = False
-        truncated = self.timestep > 100
+        truncated = self.timestep > MAX_EPISODE_STEPS
         info = {"is_success": False}
 
         return obs, reward, terminated, truncated, info
@@ -80,13 +95,30 @@ class DummyBackend(SimulationEnv):
             joint_pos=self.joint_pos.copy(),
             joint_vel=self.joint_vel.copy(),
             object_states={"target": self.object_pos.copy()},
-            timestamp=self.timestep * 0.01,
+            timestamp=self.timestep * DT,
         )
 
     def set_state(self, state: State) -> None:
         self.joint_pos = state.joint_pos.copy()
         self.joint_vel = state.joint_vel.copy()
-        self.timestep = int(state.timestamp / 0.01)
+        if "target" in state.object_states:
+            self.object_pos = state.object_states["target"].copy()
+        self.timestep = int(round(state.timestamp / DT))
+
+    def snapshot(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if out is None:
+            out = np.empty(SNAPSHOT_SIZE, dtype=self.joint_pos.dtype)
+        out[0:7] = self.joint_pos
+        out[7:14] = self.joint_vel
+        out[14:17] = self.object_pos
+        out[17] = self.timestep * DT
+        return out
+
+    def restore(self, buf: np.ndarray) -> None:
+        self.joint_pos[:] = buf[0:7]
+        self.joint_vel[:] = buf[7:14]
+        self.object_pos[:] = buf[14:17]
+        self.timestep = int(round(buf[17] / DT))
 
     @property
     def action_space(self) -> gym.Space:
@@ -97,17 +129,21 @@ class DummyBackend(SimulationEnv):
         return self._observation_space
 
     def _get_obs(self) -> Observation:
-        proprio = np.concatenate([self.joint_pos, self.joint_vel])
-
-        # Apply sensor noise
-        if self._sensor_params:
-            noise_scale = self._sensor_params.get("noise_scale", 0.0)
-            if noise_scale > 0:
-                proprio += np.random.normal(0, noise_scale, size=proprio.shape)
-
-        # Pad to match observation space shape if needed, or define obs space dynamically
-        extra = np.zeros(self.observation_space.shape[0] - len(proprio))
-        full_obs = np.concatenate([proprio, extra])
+        # One float32 array in the observation-space layout:
+        # [joint_pos(7), joint_vel(7), zero padding(6)]
+        full_obs = np.zeros(self.observation_space.shape, dtype=self.observation_space.dtype)
+        proprio = full_obs[:14]
+        proprio[:7] = self.joint_pos
+        proprio[7:] = self.joint_vel
+
+        # Apply sensor noise from the stream drawn at reset
+        noise = self._noise_stream
+        if noise is not None:
+            if self.timestep < noise.shape[0]:
+                proprio += noise[self.timestep]
+            else:
+                noise_scale = self._sensor_params["noise_scale"]
+                proprio += self._rng.normal(0, noise_scale, size=proprio.shape)
 
         return Observation(proprio=full_obs, timestep=self.timestep)
 
@@ -119,7 +155,30 @@ class DummyBackend(SimulationEnv):
         self._dynamics_params = params
 
     def update_sensors(self, params: Dict[str, float]) -> None:
+        changed = params.get("noise_scale", 0.0) != self._sensor_params.get("noise_scale", 0.0)
         self._sensor_params = params
+        if changed:
+            self._resample_noise()
 
     def update_action(self, params: Dict[str, float]) -> None:
+        changed = params.get("dropout", 0.0) != self._action_params.get("dropout", 0.0)
         self._action_params = params
+        if changed:
+            self._resample_dropout()
+
+    def _resample_dropout(self) -> None:
+        # One vectorized draw per episode replaces a scalar RNG call + branch per step.
+        dropout = self._action_params.get("dropout", 0.0)
+        if dropout > 0:
+            self._dropout_mask = self._rng.random(MAX_EPISODE_STEPS + 2) < dropout
+        else:
+            self._dropout_mask = None
+
+    def _resample_noise(self) -> None:
+        noise_scale = self._sensor_params.get("noise_scale", 0.0)
+        if noise_scale > 0:
+            self._noise_stream = (
+                self._rng.standard_normal((MAX_EPISODE_STEPS + 2, 14)) * noise_scale
+            )
+        else:
+            self._noise_stream = None
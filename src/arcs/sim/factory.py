@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import importlib
 import time
 from typing import Dict, Optional, Tuple, Type
@@ -6,9 +6,9 @@ from typing import Dict, Optional, Tuple, Type
 import gymnasium as gym
 import numpy as np
 
-from arcs.sim.interfaces import SimulationEnv
+from arcs.sim.interfaces import Observation, SimulationEnv
 from arcs.sim.randomization import DomainRandomizer, RandomizationConfig, RandomizationWrapper
-from arcs.sim.vectorized import VectorizedEnv
+from arcs.sim.vectorized import VectorizedEnv, WorkerMode
 from arcs.utils.logging import log_event, new_correlation_id
 
 
@@ -29,6 +29,7 @@ class BackendConfig:
     control_freq: int = 30
     render_mode: Optional[str] = None
     domain_randomization_config: Optional[RandomizationConfig] = None
+    worker_mode: WorkerMode = "sync"
 
 
 @dataclass
@@ -71,7 +72,12 @@ class SimulationBackendFactory:
         start_time = time.perf_counter()
         if num_envs > 1 and not getattr(backend_cls, "supports_vectorized", False):
             env: SimulationEnv = VectorizedEnv(
-                backend_cls, task_name=task, num_envs=num_envs, device=device, config=config
+                backend_cls,
+                task_name=task,
+                num_envs=num_envs,
+                device=device,
+                config=config,
+                worker_mode=config.worker_mode,
             )
         else:
             env = backend_cls(
@@ -220,6 +226,78 @@ class LoggedEnv(SimulationEnv):
     def set_state(self, state):
         self._env.set_state(state)
 
+    def snapshot(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return self._env.snapshot(out)
+
+    def restore(self, buf: np.ndarray) -> None:
+        self._env.restore(buf)
+
+    @property
+    def action_space(self):
+        return self._env.action_space
+
+    @property
+    def observation_space(self):
+        return self._env.observation_space
+
+    def update_dynamics(self, params: Dict[str, float]) -> None:
+        self._env.update_dynamics(params)
+
+    def update_visual(self, params: Dict[str, float]) -> None:
+        self._env.update_visual(params)
+
+    def update_sensors(self, params: Dict[str, float]) -> None:
+        self._env.update_sensors(params)
+
+    def update_action(self, params: Dict[str, float]) -> None:
+        self._env.update_action(params)
+
+    def close(self):
+        self._env.close()
+
+
+class AutoResetWrapper(SimulationEnv):
+    """
+    Resets the wrapped env as soon as an episode ends, so step always returns a
+    live observation. On the ending step the reset observation is returned and
+    the final one (proprio copied, as backends may reuse their buffer) moves to
+    info["final_observation"], with the step's own info under info["final_info"].
+
+    Single-env only: terminated/truncated are read as scalar bools, so wrapping
+    an env with num_envs > 1 raises ValueError.
+    """
+
+    def __init__(self, env: SimulationEnv):
+        if getattr(env, "num_envs", 1) > 1:
+            raise ValueError("AutoResetWrapper only supports single (num_envs == 1) envs")
+        self._env = env
+        self.correlation_id = getattr(env, "correlation_id", None)
+
+    def reset(self, seed: Optional[int] = None) -> Observation:
+        return self._env.reset(seed=seed)
+
+    def step(self, action: np.ndarray):
+        obs, reward, terminated, truncated, info = self._env.step(action)
+        if terminated or truncated:
+            info = {
+                "final_observation": replace(obs, proprio=obs.proprio.copy()),
+                "final_info": info,
+            }
+            obs = self._env.reset()
+        return obs, reward, terminated, truncated, info
+
+    def get_state(self):
+        return self._env.get_state()
+
+    def set_state(self, state):
+        self._env.set_state(state)
+
+    def snapshot(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return self._env.snapshot(out)
+
+    def restore(self, buf: np.ndarray) -> None:
+        self._env.restore(buf)
+
     @property
     def action_space(self):
         return self._env.action_space
@@ -247,6 +325,9 @@ class LoggedEnv(SimulationEnv):
 SimulationBackendFactory.register_backend(
     "dummy", "arcs.sim.backends.dummy", "DummyBackend"
 )
+SimulationBackendFactory.register_backend(
+    "dummy_batched", "arcs.sim.backends.batched_dummy", "BatchedDummyBackend"
+)
 SimulationBackendFactory.register_backend(
     "isaacgym", "arcs.sim.backends.isaacgym", "IsaacGymBackend"
 )
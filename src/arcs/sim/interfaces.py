@@ -4,7 +4,9 @@ from typing import Dict, Optional, Tuple, Any
 import numpy as np
 import gymnasium as gym
 
-@dataclass
+from arcs.utils.compat import DATACLASS_SLOTS
+
+@dataclass(**DATACLASS_SLOTS)
 class Observation:
     """Standardized observation dataclass."""
     proprio: np.ndarray  # Joint angles, velocities
@@ -18,7 +20,7 @@ class Observation:
         if self.metadata is None:
             self.metadata = {}
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class State:
     """System state for checkpointing/planning."""
     joint_pos: np.ndarray
@@ -59,6 +61,48 @@ class SimulationEnv(ABC):
         """Set system state (e.g. for MPPI rollouts)."""
         pass
 
+    def snapshot(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Pack the system state into a flat array for cheap checkpointing.
+        Layout: [joint_pos, joint_vel, object_states (sorted by key), timestamp].
+        Backends may override this with an allocation-free fast path.
+        """
+        state = self.get_state()
+        parts = [np.ravel(state.joint_pos), np.ravel(state.joint_vel)]
+        parts += [np.ravel(state.object_states[key]) for key in sorted(state.object_states)]
+        parts.append(np.array([state.timestamp]))
+        flat = np.concatenate(parts)
+        if out is None:
+            return flat
+        out[...] = flat
+        return out
+
+    def restore(self, buf: np.ndarray) -> None:
+        """Restore a state packed by `snapshot`."""
+        template = self.get_state()
+        offset = 0
+
+        def take(like: np.ndarray) -> np.ndarray:
+            nonlocal offset
+            like = np.asarray(like)
+            value = np.asarray(buf[offset : offset + like.size]).reshape(like.shape)
+            offset += like.size
+            return value.astype(like.dtype)
+
+        joint_pos = take(template.joint_pos)
+        joint_vel = take(template.joint_vel)
+        object_states = {
+            key: take(template.object_states[key]) for key in sorted(template.object_states)
+        }
+        self.set_state(
+            State(
+                joint_pos=joint_pos,
+                joint_vel=joint_vel,
+                object_states=object_states,
+                timestamp=float(buf[offset]),
+            )
+        )
+
     @property
     @abstractmethod
     def action_space(self) -> gym.Space:
@@ -1,10 +1,10 @@
-from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple, Literal
-from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Literal, Type
 
 import numpy as np
 
 from arcs.sim.interfaces import Observation, SimulationEnv
+from arcs.utils.compat import DATACLASS_SLOTS
 from arcs.utils.logging import log_event, new_correlation_id
 
 
@@ -12,7 +12,7 @@ DistributionKind = Literal["uniform", "normal", "truncated_normal"]
 ScheduleKind = Literal["fixed", "curriculum"]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Distribution:
     kind: DistributionKind = "uniform"
     low: Optional[float] = None
@@ -21,33 +21,52 @@ class Distribution:
     std: float = 1.0
 
     def sample(self, rng: np.random.Generator, scale: float = 1.0) -> float:
-        if self.kind == "uniform":
-            if self.low is None or self.high is None:
-                raise ValueError("Uniform distribution requires low/high")
-            if self.low > self.high:
-                raise ValueError("Uniform distribution requires low <= high")
-            mid = 0.5 * (self.low + self.high)
-            half = 0.5 * (self.high - self.low) * max(0.0, scale)
-            return rng.uniform(mid - half, mid + half)
-        if self.kind == "normal":
-            return rng.normal(self.mean, self.std * max(0.0, scale))
-        if self.kind == "truncated_normal":
-            if self.low is None or self.high is None:
-                raise ValueError("Truncated normal requires low/high")
-            if self.low > self.high:
-                raise ValueError("Truncated normal requires low <= high")
-            value = rng.normal(self.mean, self.std * max(0.0, scale))
-            return float(np.clip(value, self.low, self.high))
-        raise ValueError(f"Unsupported distribution kind: {self.kind}")
-
-
-@dataclass
+        sampler = _DISTRIBUTION_SAMPLERS.get(self.kind)
+        if sampler is None:
+            raise ValueError(f"Unsupported distribution kind: {self.kind}")
+        return sampler(self, rng, max(0.0, scale))
+
+    def _sample_uniform(self, rng: np.random.Generator, scale: float) -> float:
+        if self.low is None or self.high is None:
+            raise ValueError("Uniform distribution requires low/high")
+        if self.low > self.high:
+            raise ValueError("Uniform distribution requires low <= high")
+        mid = 0.5 * (self.low + self.high)
+        half = 0.5 * (self.high - self.low) * scale
+        return rng.uniform(mid - half, mid + half)
+
+    def _sample_normal(self, rng: np.random.Generator, scale: float) -> float:
+        return rng.normal(self.mean, self.std * scale)
+
+    def _sample_truncated_normal(self, rng: np.random.Generator, scale: float) -> float:
+        if self.low is None or self.high is None:
+            raise ValueError("Truncated normal requires low/high")
+        if self.low > self.high:
+            raise ValueError("Truncated normal requires low <= high")
+        value = rng.normal(self.mean, self.std * scale)
+        return min(max(value, self.low), self.high)
+
+
+# Resolved by kind with one dict lookup instead of a chain of string compares.
+# Looked up per call (not bound at construction) so edits to `kind` take effect.
+_DISTRIBUTION_SAMPLERS = {
+    "uniform": Distribution._sample_uniform,
+    "normal": Distribution._sample_normal,
+    "truncated_normal": Distribution._sample_truncated_normal,
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Schedule:
     kind: ScheduleKind = "fixed"
     start: float = 0.0
     end: float = 1.0
     steps: int = 1
 
+    @property
+    def is_fixed(self) -> bool:
+        return self.kind == "fixed"
+
     def scale(self, step: int, progress: float) -> float:
         if self.kind == "fixed":
             return 1.0
@@ -59,17 +78,19 @@ class Schedule:
         raise ValueError(f"Unsupported schedule kind: {self.kind}")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RandomizationParam:
     distribution: Distribution
     schedule: Schedule = field(default_factory=Schedule)
 
     def sample(self, rng: np.random.Generator, step: int, progress: float) -> float:
+        if self.schedule.is_fixed:
+            return self.distribution.sample(rng)
         scale = self.schedule.scale(step=step, progress=progress)
         return self.distribution.sample(rng, scale=scale)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DynamicsRandomizationConfig:
     mass_scale: RandomizationParam = field(
         default_factory=lambda: RandomizationParam(
@@ -88,7 +109,7 @@ class DynamicsRandomizationConfig:
     )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class VisualRandomizationConfig:
     lighting_intensity: RandomizationParam = field(
         default_factory=lambda: RandomizationParam(
@@ -97,7 +118,7 @@ class VisualRandomizationConfig:
     )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SensorRandomizationConfig:
     joint_position_noise: RandomizationParam = field(
         default_factory=lambda: RandomizationParam(
@@ -121,7 +142,7 @@ class SensorRandomizationConfig:
     )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ActionRandomizationConfig:
     latency_s: RandomizationParam = field(
         default_factory=lambda: RandomizationParam(
@@ -135,7 +156,7 @@ class ActionRandomizationConfig:
     )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RandomizationConfig:
     dynamics: DynamicsRandomizationConfig = field(default_factory=DynamicsRandomizationConfig)
     visual: VisualRandomizationConfig = field(default_factory=VisualRandomizationConfig)
@@ -143,45 +164,256 @@ class RandomizationConfig:
     action: ActionRandomizationConfig = field(default_factory=ActionRandomizationConfig)
 
 
+class ArrayQueue:
+    """
+    FIFO of fixed-shape arrays (or tuples of arrays/None) held in a preallocated ring.
+    Mirrors the deque calls used here (append, popleft, len, clear). append copies
+    into the ring, so callers may reuse their buffers. popleft returns views of the
+    popped slot, which the next append or clear may overwrite; copy anything that
+    must outlive that.
+    """
+
+    def __init__(self, capacity: int = 4):
+        self._capacity = max(1, int(capacity))
+        self._head = 0
+        self._count = 0
+        self._is_tuple = False
+        self._slots: Optional[List[Optional[np.ndarray]]] = None
+        self._present: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    def append(self, item: Any) -> None:
+        values = item if isinstance(item, tuple) else (item,)
+        if self._slots is None:
+            self._is_tuple = isinstance(item, tuple)
+            self._slots = [None] * len(values)
+            self._present = np.zeros((self._capacity, len(values)), dtype=bool)
+        if self._count == self._capacity:
+            self._grow()
+        idx = (self._head + self._count) % self._capacity
+        for k, value in enumerate(values):
+            if value is None:
+                self._present[idx, k] = False
+                continue
+            slot = self._slots[k]
+            if slot is None:
+                value = np.asarray(value)
+                slot = np.empty((self._capacity,) + value.shape, dtype=value.dtype)
+                self._slots[k] = slot
+            np.copyto(slot[idx], value)
+            self._present[idx, k] = True
+        self._count += 1
+
+    def popleft(self) -> Any:
+        if self._count == 0:
+            raise IndexError("pop from an empty ArrayQueue")
+        idx = self._head
+        self._head = (self._head + 1) % self._capacity
+        self._count -= 1
+        out = tuple(
+            slot[idx] if slot is not None and self._present[idx, k] else None
+            for k, slot in enumerate(self._slots)
+        )
+        return out if self._is_tuple else out[0]
+
+    def _grow(self) -> None:
+        order = (self._head + np.arange(self._count)) % self._capacity
+        capacity = self._capacity * 2
+        for k, slot in enumerate(self._slots):
+            if slot is not None:
+                grown = np.empty((capacity,) + slot.shape[1:], dtype=slot.dtype)
+                grown[: self._count] = slot[order]
+                self._slots[k] = grown
+        present = np.zeros((capacity, len(self._slots)), dtype=bool)
+        present[: self._count] = self._present[order]
+        self._present = present
+        self._capacity = capacity
+        self._head = 0
+
+
+def _max_delay_steps(param: RandomizationParam, control_freq: int) -> Optional[int]:
+    """Largest delay a latency param can produce, or None if it is unbounded."""
+    dist = param.distribution
+    if dist.kind in ("uniform", "truncated_normal") and dist.high is not None:
+        return max(0, int(round(dist.high * control_freq)))
+    return None
+
+
+class _CompiledRandomizer:
+    """
+    Flattened view of a group of RandomizationParams for batched sampling.
+    Every lane is drawn as mean + std * scale * noise, where noise is 2u - 1 for
+    uniform lanes and a standard normal for the others; truncated lanes are then
+    clipped to [low, high]. One call draws all lanes with a single RNG call per kind.
+    """
+
+    def __init__(
+        self, groups: Sequence[str], entries: Sequence[Tuple[str, str, RandomizationParam]]
+    ):
+        self.groups = tuple(groups)
+        self.keys: List[Tuple[str, str]] = [(group, name) for group, name, _ in entries]
+        # Per group: (group, field names, start, stop) over the contiguous lanes.
+        self._group_layout: List[Tuple[str, Tuple[str, ...], int, int]] = []
+        for group in self.groups:
+            lanes = [idx for idx, (lane_group, _) in enumerate(self.keys) if lane_group == group]
+            start, stop = (lanes[0], lanes[-1] + 1) if lanes else (0, 0)
+            names = tuple(self.keys[idx][1] for idx in range(start, stop))
+            self._group_layout.append((group, names, start, stop))
+        self.params: List[RandomizationParam] = [param for _, _, param in entries]
+        size = len(entries)
+        self._uniform = np.zeros(size, dtype=bool)
+        self._mean = np.zeros(size)
+        self._std = np.zeros(size)
+        self._low = np.full(size, -np.inf)
+        self._high = np.full(size, np.inf)
+        for idx, param in enumerate(self.params):
+            dist = param.distribution
+            if dist.kind == "uniform":
+                if dist.low is None or dist.high is None:
+                    raise ValueError("Uniform distribution requires low/high")
+                if dist.low > dist.high:
+                    raise ValueError("Uniform distribution requires low <= high")
+                self._uniform[idx] = True
+                self._mean[idx] = 0.5 * (dist.low + dist.high)
+                self._std[idx] = 0.5 * (dist.high - dist.low)
+            elif dist.kind in ("normal", "truncated_normal"):
+                self._mean[idx] = dist.mean
+                self._std[idx] = dist.std
+                if dist.kind == "truncated_normal":
+                    if dist.low is None or dist.high is None:
+                        raise ValueError("Truncated normal requires low/high")
+                    if dist.low > dist.high:
+                        raise ValueError("Truncated normal requires low <= high")
+                    self._low[idx] = dist.low
+                    self._high[idx] = dist.high
+            else:
+                raise ValueError(f"Unsupported distribution kind: {dist.kind}")
+        for lane_array in (self._uniform, self._mean, self._std, self._low, self._high):
+            lane_array.setflags(write=False)
+        self._has_uniform = bool(self._uniform.any())
+        self._has_normal = not bool(self._uniform.all())
+
+        # Lanes sharing an identical schedule share one scale evaluation per draw;
+        # fixed schedules always scale by 1 and are skipped entirely.
+        lanes_by_schedule: Dict[Tuple, List[int]] = {}
+        schedules: Dict[Tuple, Schedule] = {}
+        for idx, param in enumerate(self.params):
+            sched = param.schedule
+            if sched.is_fixed:
+                continue
+            key = (sched.kind, sched.start, sched.end, sched.steps)
+            schedules.setdefault(key, sched)
+            lanes_by_schedule.setdefault(key, []).append(idx)
+        self._schedule_lanes = [
+            (schedules[key], np.asarray(lanes)) for key, lanes in lanes_by_schedule.items()
+        ]
+        self._scale = np.ones(size)
+
+        # Value every lane collapses to when its spread (std * scale) is zero.
+        self._centre = np.clip(self._mean, self._low, self._high)
+        self._centre.setflags(write=False)
+        self._centre_params = self.to_params(self._centre)
+
+    def sample_params(
+        self, rng: np.random.Generator, step: int, progress: float
+    ) -> Dict[str, Dict[str, float]]:
+        """Draw every lane and return them as nested {group: {name: value}} params."""
+        scale = self._update_scale(step, progress)
+        if not (self._std * scale).any():
+            # Nothing is randomized (e.g. zero-width ranges or a curriculum at
+            # zero): skip the RNG and hand out a copy of the cached centre values.
+            return {group: dict(values) for group, values in self._centre_params.items()}
+        return self.to_params(self._draw(rng, scale))
+
+    def _update_scale(self, step: int, progress: float) -> np.ndarray:
+        scale = self._scale
+        for schedule, lanes in self._schedule_lanes:
+            scale[lanes] = max(0.0, schedule.scale(step=step, progress=progress))
+        return scale
+
+    def _draw(self, rng: np.random.Generator, scale: np.ndarray) -> np.ndarray:
+        size = len(self.params)
+        if self._has_uniform and self._has_normal:
+            noise = np.where(
+                self._uniform, 2.0 * rng.random(size) - 1.0, rng.standard_normal(size)
+            )
+        elif self._has_uniform:
+            noise = 2.0 * rng.random(size) - 1.0
+        else:
+            noise = rng.standard_normal(size)
+        values = self._mean + self._std * scale * noise
+        return np.clip(values, self._low, self._high, out=values)
+
+    def to_params(self, values: np.ndarray) -> Dict[str, Dict[str, float]]:
+        flat = values.tolist()
+        return {
+            group: dict(zip(names, flat[start:stop]))
+            for group, names, start, stop in self._group_layout
+        }
+
+
+def _compile_groups(config: RandomizationConfig, groups: Sequence[str]) -> _CompiledRandomizer:
+    entries = []
+    for group in groups:
+        group_config = getattr(config, group)
+        for f in fields(group_config):
+            entries.append((group, f.name, getattr(group_config, f.name)))
+    return _CompiledRandomizer(groups, entries)
+
+
 class DomainRandomizer:
-    """Applies structured randomization to the simulation environment."""
+    """
+    Applies structured randomization to the simulation environment.
+    Distributions are compiled from the config at construction; create a new
+    randomizer after editing the config.
+
+    Draws use SFC64 by default, which is cheaper per call than the PCG64 behind
+    np.random.default_rng, so sequences differ from older releases for the same
+    seed. Pass bit_generator=np.random.Philox when independent parallel streams
+    (via .jumped()) matter more than raw speed.
+    """
 
     def __init__(
         self,
         config: Optional[RandomizationConfig] = None,
         control_freq: int = 30,
         seed: Optional[int] = None,
+        log_every: int = 1,
+        bit_generator: Type[np.random.BitGenerator] = np.random.SFC64,
     ):
+        if log_every < 1:
+            raise ValueError("log_every must be >= 1")
         self.config = config or RandomizationConfig()
         self.control_freq = control_freq
-        self._rng = np.random.default_rng(seed)
+        self.log_every = log_every
+        self._rng = np.random.Generator(bit_generator(seed))
         self._episode = 0
         self._step = 0
         self._curriculum_progress = 1.0
+        self._episode_sampler = _compile_groups(self.config, ("dynamics", "visual"))
+        self._step_sampler = _compile_groups(self.config, ("sensor", "action"))
+        self._noise_bufs: Dict[str, np.ndarray] = {}
+        self._zero_action: Optional[np.ndarray] = None
+        # Delays (in control steps) for the params last returned by randomize_step
+        self._step_params: Optional[Dict[str, Dict[str, float]]] = None
+        self._action_delay_steps = 0
+        self._camera_delay_steps = 0
 
     def set_curriculum_progress(self, progress: float) -> None:
-        self._curriculum_progress = float(np.clip(progress, 0.0, 1.0))
+        progress = float(progress)
+        self._curriculum_progress = 0.0 if progress < 0.0 else (1.0 if progress > 1.0 else progress)
 
     def randomize_episode(self, env: SimulationEnv) -> Dict[str, Dict[str, float]]:
         self._episode += 1
-        params = {
-            "dynamics": {
-                "mass_scale": self.config.dynamics.mass_scale.sample(
-                    self._rng, self._episode, self._curriculum_progress
-                ),
-                "friction_scale": self.config.dynamics.friction_scale.sample(
-                    self._rng, self._episode, self._curriculum_progress
-                ),
-                "damping_scale": self.config.dynamics.damping_scale.sample(
-                    self._rng, self._episode, self._curriculum_progress
-                ),
-            },
-            "visual": {
-                "lighting_intensity": self.config.visual.lighting_intensity.sample(
-                    self._rng, self._episode, self._curriculum_progress
-                )
-            },
-        }
+        params = self._episode_sampler.sample_params(
+            self._rng, self._episode, self._curriculum_progress
+        )
         env.update_dynamics(params["dynamics"])
         env.update_visual(params["visual"])
         correlation_id = getattr(env, "correlation_id", None) or new_correlation_id()
@@ -195,92 +427,110 @@ class DomainRandomizer:
 
     def randomize_step(self, env: SimulationEnv) -> Dict[str, Dict[str, float]]:
         self._step += 1
-        params = {
-            "sensor": {
-                "joint_position_noise": self.config.sensor.joint_position_noise.sample(
-                    self._rng, self._step, self._curriculum_progress
-                ),
-                "joint_velocity_noise": self.config.sensor.joint_velocity_noise.sample(
-                    self._rng, self._step, self._curriculum_progress
-                ),
-                "force_torque_noise": self.config.sensor.force_torque_noise.sample(
-                    self._rng, self._step, self._curriculum_progress
-                ),
-                "camera_latency_s": self.config.sensor.camera_latency_s.sample(
-                    self._rng, self._step, self._curriculum_progress
-                ),
-            },
-            "action": {
-                "latency_s": self.config.action.latency_s.sample(
-                    self._rng, self._step, self._curriculum_progress
-                ),
-                "dropout_prob": float(
-                    np.clip(
-                        self.config.action.dropout_prob.sample(
-                            self._rng, self._step, self._curriculum_progress
-                        ),
-                        0.0,
-                        1.0,
-                    )
-                ),
-            },
-        }
+        params = self._step_sampler.sample_params(
+            self._rng, self._step, self._curriculum_progress
+        )
+        action_params = params["action"]
+        dropout_prob = action_params["dropout_prob"]
+        action_params["dropout_prob"] = (
+            0.0 if dropout_prob < 0.0 else (1.0 if dropout_prob > 1.0 else dropout_prob)
+        )
+        # Delays in control steps, computed once here rather than in every apply_* call;
+        # kept on the randomizer so the params passed to the env stay as sampled.
+        self._step_params = params
+        self._action_delay_steps = self._delay_steps(action_params["latency_s"])
+        self._camera_delay_steps = self._delay_steps(params["sensor"]["camera_latency_s"])
         env.update_sensors(params["sensor"])
         env.update_action(params["action"])
-        correlation_id = getattr(env, "correlation_id", None) or new_correlation_id()
-        log_event(
-            "randomization.step",
-            correlation_id,
-            randomization_params=params,
-            curriculum_stage=self._curriculum_progress,
-        )
+        if self._step % self.log_every == 0:
+            correlation_id = getattr(env, "correlation_id", None) or new_correlation_id()
+            log_event(
+                "randomization.step",
+                correlation_id,
+                randomization_params=params,
+                curriculum_stage=self._curriculum_progress,
+            )
         return params
 
     def apply_action(
         self,
         action: np.ndarray,
         params: Dict[str, Dict[str, float]],
-        action_queue: deque,
+        action_queue: ArrayQueue,
     ) -> np.ndarray:
-        latency_s = params.get("action", {}).get("latency_s", 0.0)
-        dropout_prob = params.get("action", {}).get("dropout_prob", 0.0)
-        if self._rng.random() < dropout_prob:
-            action = np.zeros_like(action)
-        delay_steps = int(round(latency_s * self.control_freq))
+        action_params = params.get("action", {})
+        dropout_prob = action_params.get("dropout_prob", 0.0)
+        if dropout_prob > 0.0 and self._rng.random() < dropout_prob:
+            action = self._zeros_like(action)
+        if params is self._step_params:
+            delay_steps = self._action_delay_steps
+        else:
+            delay_steps = self._delay_steps(action_params.get("latency_s", 0.0))
         if delay_steps <= 0:
             return action
         action_queue.append(action)
-        if len(action_queue) <= delay_steps:
-            return np.zeros_like(action)
-        return action_queue.popleft()
+        return (
+            action_queue.popleft()
+            if len(action_queue) > delay_steps
+            else self._zeros_like(action)
+        )
+
+    def _delay_steps(self, latency_s: float) -> int:
+        return int(round(latency_s * self.control_freq))
+
+    def _zeros_like(self, action: np.ndarray) -> np.ndarray:
+        """Shared read-only zero action; callers that need to mutate it must copy."""
+        zero = self._zero_action
+        action = np.asarray(action)
+        if zero is None or zero.shape != action.shape or zero.dtype != action.dtype:
+            zero = np.zeros_like(action)
+            zero.setflags(write=False)
+            self._zero_action = zero
+        return zero
 
     def apply_observation(
         self,
         obs: Observation,
         params: Dict[str, Dict[str, float]],
-        camera_queue: deque,
+        camera_queue: ArrayQueue,
     ) -> Observation:
         sensor_params = params.get("sensor", {})
         noise_scale = sensor_params.get("joint_position_noise", 0.0)
-        obs.proprio = obs.proprio + self._rng.normal(
-            0.0, noise_scale, size=obs.proprio.shape
-        )
+        obs.proprio = self._add_noise("proprio", obs.proprio, noise_scale)
         if obs.tactile is not None:
             tactile_noise = sensor_params.get("force_torque_noise", 0.0)
-            obs.tactile = obs.tactile + self._rng.normal(
-                0.0, tactile_noise, size=obs.tactile.shape
-            )
-        latency_s = sensor_params.get("camera_latency_s", 0.0)
-        delay_steps = int(round(latency_s * self.control_freq))
+            obs.tactile = self._add_noise("tactile", obs.tactile, tactile_noise)
+        if params is self._step_params:
+            delay_steps = self._camera_delay_steps
+        else:
+            delay_steps = self._delay_steps(sensor_params.get("camera_latency_s", 0.0))
         if delay_steps > 0 and obs.rgb is not None:
+            # The queue copies frames in: vectorized envs reuse their image buffers.
             camera_queue.append((obs.rgb, obs.depth))
             if len(camera_queue) <= delay_steps:
                 obs.rgb = None
                 obs.depth = None
             else:
-                obs.rgb, obs.depth = camera_queue.popleft()
+                # Popped frames are ring views; copy them out, since callers may
+                # keep observations past the next append.
+                rgb, depth = camera_queue.popleft()
+                obs.rgb = rgb.copy()
+                obs.depth = None if depth is None else depth.copy()
         return obs
 
+    def _add_noise(self, key: str, values: np.ndarray, scale: float) -> np.ndarray:
+        """Add zero-mean Gaussian noise drawn into a reused per-field buffer."""
+        if scale == 0.0:
+            return values
+        buf = self._noise_bufs.get(key)
+        if buf is None or buf.shape != values.shape:
+            buf = np.empty(values.shape)
+            self._noise_bufs[key] = buf
+        self._rng.standard_normal(out=buf)
+        buf *= scale
+        # Not in place: backends may hand out views of their internal state.
+        return np.add(values, buf)
+
 
 class AutomaticDomainRandomization:
     """Simple ADR controller that expands ranges based on success rate."""
@@ -311,8 +561,13 @@ class RandomizationWrapper(SimulationEnv):
     def __init__(self, env: SimulationEnv, randomizer: DomainRandomizer):
         self._env = env
         self._randomizer = randomizer
-        self._action_queue: deque = deque()
-        self._camera_queue: deque = deque()
+        # Size the rings for the largest configured delay; unbounded latency
+        # distributions start small and grow on demand.
+        config = randomizer.config
+        action_delay = _max_delay_steps(config.action.latency_s, randomizer.control_freq)
+        camera_delay = _max_delay_steps(config.sensor.camera_latency_s, randomizer.control_freq)
+        self._action_queue = ArrayQueue(4 if action_delay is None else action_delay + 2)
+        self._camera_queue = ArrayQueue(4 if camera_delay is None else camera_delay + 2)
         self.correlation_id = getattr(env, "correlation_id", None)
 
     def reset(self, seed: Optional[int] = None) -> Observation:
@@ -338,6 +593,12 @@ class RandomizationWrapper(SimulationEnv):
     def set_state(self, state):
         self._env.set_state(state)
 
+    def snapshot(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return self._env.snapshot(out)
+
+    def restore(self, buf: np.ndarray) -> None:
+        self._env.restore(buf)
+
     @property
     def action_space(self):
         return self._env.action_space
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 from typing import Dict, Tuple
 from arcs.sim.interfaces import Observation
@@ -22,41 +24,49 @@ class ManipulationTask(DummyBackend):
 
 
 class ReachTask(ManipulationTask):
+    """
+    Reach a fixed goal with the first three joints.
+
+    Observations are written into one preallocated buffer, so the proprio array
+    returned by reset/step is overwritten by the next call; copy it to keep it.
+    """
+
     def __init__(self):
         super().__init__("Reach")
         self.goal = np.array([0.5, 0.0, 0.5])
+        # structure: [joint_pos(7), joint_vel(7), goal_err(3), padding(3)] -> 20 dim matches DummyBackend
+        self._obs_buf = np.zeros(
+            self.observation_space.shape[0], dtype=self.observation_space.dtype
+        )
+        self._pos_slc = slice(0, 7)
+        self._vel_slc = slice(7, 14)
+        self._goal_slc = slice(14, 17)
+        # Goal distance of the observation currently in _obs_buf, set by _get_obs
+        self._obs_goal_distance = 0.0
 
     def compute_reward(self, obs: Observation, action: np.ndarray) -> float:
         # Assuming first 3 elements of proprio are XYZ position
         # This is coupling to DummyBackend implementation details, which is fine for now
-        ee_pos = obs.proprio[:3]
-        dist = np.linalg.norm(ee_pos - self.goal)
-        return -dist
+        if obs.proprio is self._obs_buf:
+            return -self._obs_goal_distance
+        return -self._goal_distance(obs.proprio)
+
+    def _goal_distance(self, proprio: np.ndarray) -> float:
+        # Plain float math: np.linalg.norm dispatch dominates for a 3-vector.
+        goal = self.goal
+        dx = float(proprio[0]) - float(goal[0])
+        dy = float(proprio[1]) - float(goal[1])
+        dz = float(proprio[2]) - float(goal[2])
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
 
     def _get_obs(self) -> Observation:
-        _base_obs = super()._get_obs()
-        # Inject goal info into the observation vector
-        # structure: [joint_pos(7), joint_vel(7), goal_err(3), padding(3)] -> 20 dim matches DummyBackend
-
-        # We assume joint_pos[:3] is our "EE position" for this dummy task
-        ee_pos = self.joint_pos[:3]
-        goal_error = self.goal - ee_pos
-
-        # Verify base_obs.proprio structure from DummyBackend: [pos, vel, padding]
-        # We reconstruct it cleaner
-        proprio = np.concatenate([self.joint_pos, self.joint_vel, goal_error])
-
-        # Pad if necessary to match 20
-        needed = self.observation_space.shape[0] - len(proprio)
-        if needed > 0:
-            proprio = np.concatenate([proprio, np.zeros(needed)])
-        elif needed < 0:
-            # Expand observation space if needed (hacky for inherited class but works for python)
-            # But verify_reach.py reads obs_dim from space.
-            # Better to fit in 20. 7+7+3 = 17. Fits.
-            pass
-
-        return Observation(proprio=proprio, timestep=self.timestep)
+        # We assume joint_pos[:3] is our "EE position" for this dummy task.
+        # Padding entries stay zero from construction.
+        np.copyto(self._obs_buf[self._pos_slc], self.joint_pos)
+        np.copyto(self._obs_buf[self._vel_slc], self.joint_vel)
+        np.subtract(self.goal, self.joint_pos[:3], out=self._obs_buf[self._goal_slc])
+        self._obs_goal_distance = self._goal_distance(self._obs_buf)
+        return Observation(proprio=self._obs_buf, timestep=self.timestep)
 
     def step(self, action: np.ndarray) -> Tuple[Observation, float, bool, bool, Dict]:
         # We need to call DummyBackend step logic, but we can't easily inject changes
@@ -66,11 +76,11 @@ class ReachTask(ManipulationTask):
 
         obs, _, terminated, truncated, info = super().step(action)
 
-        # Recompute reward based on distance
+        # Recompute reward based on distance; compute_reward and the success
+        # check both read the distance _get_obs computed for this step.
         reward = self.compute_reward(obs, action)
 
-        dist = np.linalg.norm(obs.proprio[:3] - self.goal)
-        if dist < 0.05:
+        if self._obs_goal_distance < 0.05:
             info["is_success"] = True
             # terminated = True # Optional: stop on success
 
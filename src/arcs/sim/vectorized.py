@@ -1,13 +1,145 @@
-from typing import Dict, List, Optional, Tuple, Type
+import multiprocessing as mp
+import os
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Type
 
 import gymnasium as gym
 import numpy as np
 
 from arcs.sim.interfaces import Observation, SimulationEnv, State
 
+WorkerMode = Literal["sync", "thread", "process"]
+
+
+def _process_worker(conn, backend_cls: Type[SimulationEnv], env_kwargs: Dict[str, Any]) -> None:
+    """Host one env in a subprocess; proprio observations go through shared memory."""
+    env = backend_cls(**env_kwargs)
+    shm: Optional[SharedMemory] = None
+    proprio_row: Optional[np.ndarray] = None
+
+    def export(obs: Observation) -> Observation:
+        np.copyto(proprio_row, obs.proprio)
+        obs.proprio = None
+        return obs
+
+    try:
+        conn.send((True, (env.action_space, env.observation_space)))
+        while True:
+            cmd, args = conn.recv()
+            try:
+                if cmd == "attach":
+                    name, shape, dtype, index = args
+                    shm = SharedMemory(name=name)
+                    proprio_row = np.ndarray(shape, dtype=dtype, buffer=shm.buf)[index]
+                    result = None
+                elif cmd == "reset":
+                    result = export(env.reset(*args))
+                elif cmd == "step":
+                    obs, reward, terminated, truncated, info = env.step(*args)
+                    result = (export(obs), reward, terminated, truncated, info)
+                elif cmd == "close":
+                    env.close()
+                    conn.send((True, None))
+                    break
+                else:
+                    result = getattr(env, cmd)(*args)
+            except Exception as err:
+                conn.send((False, err))
+            else:
+                conn.send((True, result))
+    finally:
+        proprio_row = None
+        if shm is not None:
+            shm.close()
+        conn.close()
+
+
+class _ProcessEnv:
+    """Parent-side handle for an env running in `_process_worker`."""
+
+    def __init__(self, ctx, backend_cls: Type[SimulationEnv], env_kwargs: Dict[str, Any]):
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_process_worker, args=(child_conn, backend_cls, env_kwargs), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self.action_space, self.observation_space = self.recv()
+        self.proprio: Optional[np.ndarray] = None
+
+    def send(self, cmd: str, *args: Any) -> None:
+        self._conn.send((cmd, args))
+
+    def recv(self) -> Any:
+        ok, result = self._conn.recv()
+        if not ok:
+            raise result
+        return result
+
+    def call(self, cmd: str, *args: Any) -> Any:
+        self.send(cmd, *args)
+        return self.recv()
+
+    def attach(self, shm: SharedMemory, buffer: np.ndarray, index: int) -> None:
+        self.call("attach", shm.name, buffer.shape, buffer.dtype.str, index)
+        self.proprio = buffer[index]
+
+    def get_state(self) -> State:
+        return self.call("get_state")
+
+    def set_state(self, state: State) -> None:
+        self.call("set_state", state)
+
+    def snapshot(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        buf = self.call("snapshot")
+        if out is None:
+            return buf
+        out[...] = buf
+        return out
+
+    def restore(self, buf: np.ndarray) -> None:
+        self.call("restore", buf)
+
+    def update_dynamics(self, params: Dict[str, float]) -> None:
+        self.call("update_dynamics", params)
+
+    def update_visual(self, params: Dict[str, float]) -> None:
+        self.call("update_visual", params)
+
+    def update_sensors(self, params: Dict[str, float]) -> None:
+        self.call("update_sensors", params)
+
+    def update_action(self, params: Dict[str, float]) -> None:
+        self.call("update_action", params)
+
+    def close(self) -> None:
+        if self._process.is_alive():
+            self.call("close")
+            self._process.join()
+        self._conn.close()
+
 
 class VectorizedEnv(SimulationEnv):
-    """Simple vectorized wrapper around multiple SimulationEnv instances."""
+    """
+    Simple vectorized wrapper around multiple SimulationEnv instances.
+
+    worker_mode selects how sub-envs are stepped: "sync" runs them in turn,
+    "thread" maps them over a thread pool (useful when backends release the
+    GIL), and "process" hosts each env in a subprocess and gathers proprio
+    observations through one shared-memory array.
+
+    Backends that set `supports_batched` already step every env in one call
+    (structure-of-arrays state); for those a single instance is created with
+    num_envs lanes and every method forwards to it, so worker_mode is ignored.
+
+    The stacked proprio array has observation_space.dtype (float32 for the
+    bundled backends); sub-env observations of another dtype are cast on copy.
+
+    reset/step return the same Observation object every time, and its arrays
+    are views of buffers reused across calls; copy anything that must outlive
+    the next call, and do not mutate the arrays.
+    """
 
     supports_vectorized = True
 
@@ -18,49 +150,71 @@ class VectorizedEnv(SimulationEnv):
         num_envs: int,
         device: str,
         config: Optional[object] = None,
+        worker_mode: WorkerMode = "sync",
     ):
         if num_envs < 1:
             raise ValueError("num_envs must be >= 1")
+        if worker_mode not in ("sync", "thread", "process"):
+            raise ValueError(f"Unsupported worker_mode: {worker_mode}")
         self.num_envs = num_envs
-        self._envs: List[SimulationEnv] = [
-            backend_cls(task_name=task_name, num_envs=1, device=device, config=config)
-            for _ in range(num_envs)
-        ]
+        self.worker_mode = worker_mode
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._shm: Optional[SharedMemory] = None
+        self._shared_proprio: Optional[np.ndarray] = None
+        self._stack_bufs: Dict[str, np.ndarray] = {}
+        self._stacked_obs: Optional[Observation] = None
+        self._batched: Optional[SimulationEnv] = None
+        if getattr(backend_cls, "supports_batched", False):
+            self._batched = backend_cls(
+                task_name=task_name, num_envs=num_envs, device=device, config=config
+            )
+            self._envs: List[Any] = [self._batched]
+            self._action_space = self._batched.action_space
+            self._observation_space = self._batched.observation_space
+            return
+        env_kwargs = dict(task_name=task_name, num_envs=1, device=device, config=config)
+        if worker_mode == "process":
+            ctx = mp.get_context()
+            self._envs = [
+                _ProcessEnv(ctx, backend_cls, env_kwargs) for _ in range(num_envs)
+            ]
+            self._attach_shared_proprio()
+        else:
+            self._envs = [backend_cls(**env_kwargs) for _ in range(num_envs)]
+            if worker_mode == "thread":
+                self._pool = ThreadPoolExecutor(
+                    max_workers=min(num_envs, os.cpu_count() or 1)
+                )
         self._action_space = self._batch_space(self._envs[0].action_space, num_envs)
         self._observation_space = self._batch_space(
             self._envs[0].observation_space, num_envs
         )
 
     def reset(self, seed: Optional[int] = None) -> Observation:
-        observations = []
-        for idx, env in enumerate(self._envs):
-            env_seed = None if seed is None else seed + idx
-            observations.append(env.reset(seed=env_seed))
+        if self._batched is not None:
+            return self._batched.reset(seed=seed)
+        observations = self._dispatch(
+            "reset", [(None if seed is None else seed + idx,) for idx in range(self.num_envs)]
+        )
         return self._stack_observations(observations)
 
     def step(self, action: np.ndarray) -> Tuple[Observation, np.ndarray, np.ndarray, np.ndarray, Dict]:
-        observations = []
-        rewards = []
-        terminateds = []
-        truncateds = []
-        infos = []
-        for env, env_action in zip(self._envs, action):
-            obs, reward, terminated, truncated, info = env.step(env_action)
-            observations.append(obs)
-            rewards.append(reward)
-            terminateds.append(terminated)
-            truncateds.append(truncated)
-            infos.append(info)
+        if self._batched is not None:
+            return self._batched.step(action)
+        results = self._dispatch("step", [(env_action,) for env_action in action])
+        observations, rewards, terminateds, truncateds, infos = zip(*results)
         return (
-            self._stack_observations(observations),
+            self._stack_observations(list(observations)),
             np.asarray(rewards, dtype=np.float32),
             np.asarray(terminateds, dtype=bool),
             np.asarray(truncateds, dtype=bool),
-            {"per_env": infos},
+            {"per_env": list(infos)},
         )
 
     def get_state(self) -> State:
-        states = [env.get_state() for env in self._envs]
+        if self._batched is not None:
+            return self._batched.get_state()
+        states = self._dispatch("get_state", [()] * self.num_envs)
         joint_pos = np.stack([s.joint_pos for s in states])
         joint_vel = np.stack([s.joint_vel for s in states])
         object_states: Dict[str, np.ndarray] = {}
@@ -75,16 +229,42 @@ class VectorizedEnv(SimulationEnv):
         )
 
     def set_state(self, state: State) -> None:
-        for env, idx in zip(self._envs, range(self.num_envs)):
-            env_state = State(
-                joint_pos=state.joint_pos[idx],
-                joint_vel=state.joint_vel[idx],
-                object_states={
-                    key: value[idx] for key, value in state.object_states.items()
-                },
-                timestamp=state.timestamp,
+        if self._batched is not None:
+            self._batched.set_state(state)
+            return
+        env_states = [
+            (
+                State(
+                    joint_pos=state.joint_pos[idx],
+                    joint_vel=state.joint_vel[idx],
+                    object_states={
+                        key: value[idx] for key, value in state.object_states.items()
+                    },
+                    timestamp=state.timestamp,
+                ),
             )
-            env.set_state(env_state)
+            for idx in range(self.num_envs)
+        ]
+        self._dispatch("set_state", env_states)
+
+    def snapshot(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Pack each sub-env's snapshot into one row of a (num_envs, D) array."""
+        if self._batched is not None:
+            return self._batched.snapshot(out)
+        first = self._envs[0].snapshot(None if out is None else out[0])
+        if out is None:
+            out = np.empty((self.num_envs,) + first.shape, dtype=first.dtype)
+            out[0] = first
+        for idx in range(1, self.num_envs):
+            self._envs[idx].snapshot(out[idx])
+        return out
+
+    def restore(self, buf: np.ndarray) -> None:
+        if self._batched is not None:
+            self._batched.restore(buf)
+            return
+        for env, row in zip(self._envs, buf):
+            env.restore(row)
 
     @property
     def action_space(self) -> gym.Space:
@@ -95,24 +275,59 @@ class VectorizedEnv(SimulationEnv):
         return self._observation_space
 
     def update_dynamics(self, params: Dict[str, float]) -> None:
-        for env in self._envs:
-            env.update_dynamics(params)
+        self._dispatch("update_dynamics", [(params,)] * self.num_envs)
 
     def update_visual(self, params: Dict[str, float]) -> None:
-        for env in self._envs:
-            env.update_visual(params)
+        self._dispatch("update_visual", [(params,)] * self.num_envs)
 
     def update_sensors(self, params: Dict[str, float]) -> None:
-        for env in self._envs:
-            env.update_sensors(params)
+        self._dispatch("update_sensors", [(params,)] * self.num_envs)
 
     def update_action(self, params: Dict[str, float]) -> None:
-        for env in self._envs:
-            env.update_action(params)
+        self._dispatch("update_action", [(params,)] * self.num_envs)
 
     def close(self):
         for env in self._envs:
             env.close()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._shm is not None:
+            self._shared_proprio = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def _dispatch(self, method: str, args: Sequence[Tuple[Any, ...]]) -> List[Any]:
+        """Call `method` on every sub-env with its own argument tuple."""
+        if self._batched is not None:
+            # One instance holds every lane, so broadcast calls go out once
+            return [getattr(self._batched, method)(*args[0])]
+        if self.worker_mode == "process":
+            for env, env_args in zip(self._envs, args):
+                env.send(method, *env_args)
+            results = [env.recv() for env in self._envs]
+            if method in ("reset", "step"):
+                for env, result in zip(self._envs, results):
+                    obs = result if method == "reset" else result[0]
+                    obs.proprio = env.proprio
+            return results
+        if self._pool is not None:
+            return list(
+                self._pool.map(
+                    lambda pair: getattr(pair[0], method)(*pair[1]), zip(self._envs, args)
+                )
+            )
+        return [getattr(env, method)(*env_args) for env, env_args in zip(self._envs, args)]
+
+    def _attach_shared_proprio(self) -> None:
+        obs_space = self._envs[0].observation_space
+        shape = (self.num_envs,) + tuple(obs_space.shape)
+        dtype = np.dtype(obs_space.dtype)
+        self._shm = SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+        self._shared_proprio = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+        for idx, env in enumerate(self._envs):
+            env.attach(self._shm, self._shared_proprio, idx)
 
     def _batch_space(self, space: gym.Space, num_envs: int) -> gym.Space:
         if isinstance(space, gym.spaces.Box):
@@ -124,21 +339,45 @@ class VectorizedEnv(SimulationEnv):
         raise TypeError("VectorizedEnv only supports Box spaces for now")
 
     def _stack_observations(self, observations: List[Observation]) -> Observation:
-        proprio = np.stack([obs.proprio for obs in observations])
+        if self._shared_proprio is not None:
+            # Workers already wrote their rows into the shared buffer.
+            proprio = self._shared_proprio
+        else:
+            proprio = self._stack_into(
+                "proprio", [obs.proprio for obs in observations], self._observation_space.dtype
+            )
         rgb = None
         if observations[0].rgb is not None:
-            rgb = np.stack([obs.rgb for obs in observations])
+            rgb = self._stack_into("rgb", [obs.rgb for obs in observations])
         depth = None
         if observations[0].depth is not None:
-            depth = np.stack([obs.depth for obs in observations])
+            depth = self._stack_into("depth", [obs.depth for obs in observations])
         tactile = None
         if observations[0].tactile is not None:
-            tactile = np.stack([obs.tactile for obs in observations])
-        return Observation(
-            proprio=proprio,
-            rgb=rgb,
-            depth=depth,
-            tactile=tactile,
-            timestep=observations[0].timestep,
-            metadata={"per_env": [obs.metadata for obs in observations]},
-        )
+            tactile = self._stack_into("tactile", [obs.tactile for obs in observations])
+        stacked = self._stacked_obs
+        if stacked is None:
+            stacked = self._stacked_obs = Observation(proprio=proprio)
+        # Reassign every field: wrappers may have replaced them on the last step.
+        stacked.proprio = proprio
+        stacked.rgb = rgb
+        stacked.depth = depth
+        stacked.tactile = tactile
+        stacked.timestep = observations[0].timestep
+        metadata = stacked.metadata
+        metadata.clear()
+        metadata["per_env"] = [obs.metadata for obs in observations]
+        return stacked
+
+    def _stack_into(
+        self, key: str, arrays: List[np.ndarray], dtype: Optional[np.dtype] = None
+    ) -> np.ndarray:
+        """Copy per-env arrays into a stacked buffer allocated once per field."""
+        shape = (len(arrays),) + np.shape(arrays[0])
+        buf = self._stack_bufs.get(key)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=dtype or np.asarray(arrays[0]).dtype)
+            self._stack_bufs[key] = buf
+        for row, array in zip(buf, arrays):
+            np.copyto(row, array)
+        return buf
@@ -1,4 +1,8 @@
 import json
+import queue
+import threading
+import time
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
@@ -40,6 +44,72 @@ class TrackerConfig:
     entity: Optional[str] = None
     tags: List[str] = field(default_factory=list)
     log_dir: str = "runs"
+    flush_interval_s: float = 1.0
+
+    def __post_init__(self):
+        # The writer thread waits this long per batch; zero or less would spin.
+        if not self.flush_interval_s > 0:
+            raise ValueError(f"flush_interval_s must be > 0, got {self.flush_interval_s}")
+
+
+def _flush_loop(
+    records: "queue.SimpleQueue[Any]", fp: Any, interval: float, errors: List[BaseException]
+) -> None:
+    """
+    Writer thread body: drain queued lines into fp in batches. None stops the
+    loop and an Event is set once everything queued before it is flushed. A
+    failure is stored in errors for the tracker to re-raise. Holds no reference
+    to the tracker, so an unreferenced tracker can still be finalized.
+    """
+    last_flush = time.monotonic()
+    items: List[Any] = []
+    try:
+        while True:
+            try:
+                items = [records.get(timeout=interval)]
+            except queue.Empty:
+                items = []
+            while True:
+                try:
+                    items.append(records.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [item for item in items if isinstance(item, str)]
+            if lines:
+                fp.write("\n".join(lines) + "\n")
+            waiters = [item for item in items if isinstance(item, threading.Event)]
+            stop = any(item is None for item in items)
+            now = time.monotonic()
+            if waiters or stop or now - last_flush >= interval:
+                fp.flush()
+                last_flush = now
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+    except BaseException as err:
+        errors.append(err)
+        for item in items:
+            if isinstance(item, threading.Event):
+                item.set()
+
+
+def _shutdown_writer(records: "queue.SimpleQueue[Any]", thread: threading.Thread, fp: Any) -> None:
+    records.put(None)
+    thread.join()
+    fp.close()
+
+
+@dataclass
+class VideoStream:
+    """Handle for a video being written frame by frame via ExperimentTracker."""
+
+    name: str
+    step: int
+    fps: int
+    path: Path
+    writer: Any = None
+    frames: List[np.ndarray] = field(default_factory=list)
 
 
 class ExperimentTracker:
@@ -55,6 +125,37 @@ class ExperimentTracker:
         self._backend = config.backend
         self._wandb_run = None
 
+        # Local records are queued and written in batches by a daemon thread.
+        self._metrics_fp = self._metrics_path.open("a", encoding="utf-8", buffering=1 << 16)
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._closed = False
+        self._flush_errors: List[BaseException] = []
+        self._flush_thread = threading.Thread(
+            target=_flush_loop,
+            args=(self._queue, self._metrics_fp, config.flush_interval_s, self._flush_errors),
+            name=f"arcs-tracker-{self.run_id}",
+            daemon=True,
+        )
+        self._flush_thread.start()
+        # Stops the writer on close(), when the tracker is collected, or at
+        # interpreter exit, without keeping the tracker alive until then.
+        self._finalizer = weakref.finalize(
+            self, _shutdown_writer, self._queue, self._flush_thread, self._metrics_fp
+        )
+
+        # System probes are refreshed at most once per second.
+        self._metrics_cache: Dict[str, Any] = {}
+        self._metrics_cache_ts = float("-inf")
+        self._nvml_handle = None
+        if psutil is not None:
+            psutil.cpu_percent(interval=None)  # prime the non-blocking sampler
+        if pynvml is not None and torch is not None and torch.cuda.is_available():
+            try:
+                pynvml.nvmlInit()
+                self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            except Exception:
+                self._nvml_handle = None
+
         if self._backend == "wandb":
             if wandb is None:
                 self._backend = "local"
@@ -116,14 +217,11 @@ class ExperimentTracker:
             except Exception:
                 self._backend = "local"
         if self._backend == "local":
-            video_path = self._local_dir / f"{name}_{step}.mp4"
-            if imageio is not None:
-                imageio.mimwrite(video_path, frames, fps=fps)
-            else:
-                video_path = self._local_dir / f"{name}_{step}.npy"
-                np.save(video_path, frames)
-            payload = {"type": "video", "name": name, "step": step, "path": str(video_path)}
-            self._append_local(payload)
+            stream = self.open_video(name, step, fps=fps)
+            for frame in frames:
+                self.append_frame(stream, frame)
+            self.close_video(stream)
+            return
         log_event(
             "tracker.logged",
             self.correlation_id,
@@ -132,6 +230,57 @@ class ExperimentTracker:
             step=step,
         )
 
+    def open_video(self, name: str, step: int, fps: int = 30) -> VideoStream:
+        """Start a local video that frames are encoded into as they are appended."""
+        if imageio is None:
+            return VideoStream(name, step, fps, self._local_dir / f"{name}_{step}.npy")
+        video_path = self._local_dir / f"{name}_{step}.mp4"
+        writer = imageio.get_writer(
+            video_path,
+            fps=fps,
+            codec="libx264",
+            quality=7,
+            macro_block_size=None,
+            pixelformat="yuv420p",
+            ffmpeg_params=["-preset", "ultrafast"],
+        )
+        return VideoStream(name, step, fps, video_path, writer=writer)
+
+    def append_frame(self, stream: VideoStream, frame: np.ndarray) -> None:
+        if stream.writer is not None:
+            stream.writer.append_data(frame)
+        else:
+            stream.frames.append(np.asarray(frame))
+
+    def close_video(self, stream: VideoStream) -> None:
+        """Finish encoding the video and record it like log_video does."""
+        if stream.writer is not None:
+            stream.writer.close()
+        else:
+            np.save(stream.path, np.stack(stream.frames) if stream.frames else np.empty((0,)))
+            stream.frames.clear()
+        if self._backend == "wandb" and self._wandb_run is not None:
+            try:
+                video = wandb.Video(str(stream.path), fps=stream.fps)
+                wandb.log({stream.name: video, "step": stream.step}, step=stream.step)
+            except Exception:
+                self._backend = "local"
+        if self._backend == "local":
+            payload = {
+                "type": "video",
+                "name": stream.name,
+                "step": stream.step,
+                "path": str(stream.path),
+            }
+            self._append_local(payload)
+        log_event(
+            "tracker.logged",
+            self.correlation_id,
+            type="video",
+            name=stream.name,
+            step=stream.step,
+        )
+
     def log_artifact(self, path: str, type: str = "file") -> None:
         path_obj = Path(path)
         if self._backend == "wandb" and self._wandb_run is not None:
@@ -156,23 +305,58 @@ class ExperimentTracker:
             step=0,
         )
 
+    def flush(self) -> None:
+        """
+        Block until every queued local record has been written. Raises the
+        writer thread's exception if it has died.
+        """
+        if self._closed:
+            return
+        self._raise_flush_error()
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(timeout=0.5):
+            if not self._flush_thread.is_alive():
+                break
+        self._raise_flush_error()
+
+    def close(self) -> None:
+        """Flush queued local records and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._finalizer()
+        self._raise_flush_error()
+
+    def _raise_flush_error(self) -> None:
+        if self._flush_errors:
+            raise self._flush_errors[0]
+
     def _append_local(self, payload: Dict[str, Any]) -> None:
-        with self._metrics_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload) + "\n")
+        line = json.dumps(payload)
+        if self._closed:
+            with self._metrics_path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            return
+        self._raise_flush_error()
+        self._queue.put(line)
 
     def _system_metrics(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        if now - self._metrics_cache_ts < 1.0:
+            return self._metrics_cache
         metrics: Dict[str, Any] = {}
         if psutil is not None:
-            metrics["cpu_percent"] = psutil.cpu_percent()
+            metrics["cpu_percent"] = psutil.cpu_percent(interval=None)
             metrics["memory_mb"] = psutil.virtual_memory().used / (1024**2)
         if torch is not None and torch.cuda.is_available():
             metrics["gpu_memory_mb"] = torch.cuda.memory_allocated() / (1024**2)
-            if pynvml is not None:
+            if self._nvml_handle is not None:
                 try:
-                    pynvml.nvmlInit()
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-                    util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                    util = pynvml.nvmlDeviceGetUtilizationRates(self._nvml_handle)
                     metrics["gpu_util_percent"] = util.gpu
                 except Exception:
                     pass
+        self._metrics_cache = metrics
+        self._metrics_cache_ts = now
         return metrics
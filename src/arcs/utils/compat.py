@@ -0,0 +1,6 @@
+import sys
+from typing import Any, Dict
+
+# `@dataclass(**DATACLASS_SLOTS)` gives slotted dataclasses on Python 3.10+ and
+# plain ones on 3.9, where dataclass() has no `slots` argument.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
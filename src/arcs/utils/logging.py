@@ -2,12 +2,46 @@ import json
 import logging
 import time
 import uuid
-from typing import Any, Dict
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 
 LOGGER_NAME = "arcs"
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize numpy arrays and scalars the way orjson's OPT_SERIALIZE_NUMPY does."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, default=_json_default, separators=(",", ":"))
+
+
+# Payload keys keep insertion order (event, correlation_id, timestamp first)
+# instead of paying for sort_keys on every call. Both encoders emit the same
+# compact form and accept numpy values and non-string keys.
+_dumps: Callable[[Dict[str, Any]], str]
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(payload: Dict[str, Any]) -> str:
+        return orjson.dumps(payload, option=_ORJSON_OPTS).decode()
+
+else:
+    _dumps = _json_dumps
+
+
 def get_logger() -> logging.Logger:
     return logging.getLogger(LOGGER_NAME)
 
@@ -17,10 +51,14 @@ def new_correlation_id() -> str:
 
 
 def log_event(event: str, correlation_id: str, **fields: Any) -> None:
+    logger = get_logger()
+    # Check the level before building and serializing the payload.
+    if not logger.isEnabledFor(logging.INFO):
+        return
     payload: Dict[str, Any] = {
         "event": event,
         "correlation_id": correlation_id,
         "timestamp": time.time(),
         **fields,
     }
-    get_logger().info(json.dumps(payload, sort_keys=True))
+    logger.info(_dumps(payload))
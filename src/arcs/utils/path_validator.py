@@ -1,33 +1,68 @@
+import logging
 import os
+import sys
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Dict, Iterable, Optional
 
-from arcs.utils.logging import log_event, new_correlation_id
+from arcs.utils.logging import get_logger, log_event, new_correlation_id
+
+# Marks a trie node whose path is an allowlist root; None is never a path part.
+_TERMINAL = None
 
 
 class PathValidator:
     """Validate file paths against an allowlist to prevent path traversal."""
 
-    def __init__(self, allowlist: Optional[Iterable[str]] = None, strict: bool = False):
+    def __init__(
+        self,
+        allowlist: Optional[Iterable[str]] = None,
+        strict: bool = False,
+        access_log_every: int = 1,
+    ):
+        """
+        access_log_every samples the "file.access" event to one in every N calls;
+        blocked accesses are always logged.
+        """
+        if access_log_every < 1:
+            raise ValueError("access_log_every must be >= 1")
         if allowlist is None:
             env_paths = os.getenv("ARCS_ASSET_DIR", "")
             allowlist = [p for p in env_paths.split(os.pathsep) if p]
         self.allowlist = [Path(p).expanduser().resolve() for p in allowlist] if allowlist else []
+        # Allowlist roots as a trie over path parts: containment is one O(depth) walk.
+        self._trie: Dict[Any, Any] = {}
+        for root in self.allowlist:
+            node = self._trie
+            for part in root.parts:
+                node = node.setdefault(sys.intern(part), {})
+            node[_TERMINAL] = True
         self.strict = strict
         self.correlation_id = new_correlation_id()
+        self._logger = get_logger()
+        self._access_log_every = access_log_every
+        self._event_counter = 0
 
     def validate(self, path: str) -> Path:
-        resolved = Path(path).expanduser().resolve()
-        log_event("file.access", self.correlation_id, path=str(resolved))
+        path_str = os.fspath(path)
+        # Resolve on every call: caching the result would keep trusting a path
+        # after a symlink along it is swapped. Only the roots are resolved once.
+        resolved = Path(path_str).expanduser().resolve(strict=False)
+        resolved_str = str(resolved)
+        self._event_counter += 1
+        if self._event_counter % self._access_log_every == 0 and self._logger.isEnabledFor(
+            logging.INFO
+        ):
+            log_event("file.access", self.correlation_id, path=resolved_str)
         if not self.allowlist:
             return resolved
-        for root in self.allowlist:
-            try:
-                resolved.relative_to(root)
+        node = self._trie
+        for part in resolved.parts:
+            node = node.get(part)
+            if node is None:
+                break
+            if _TERMINAL in node:
                 return resolved
-            except ValueError:
-                continue
-        log_event("file.access.blocked", self.correlation_id, path=str(resolved))
+        log_event("file.access.blocked", self.correlation_id, path=resolved_str)
         if self.strict:
             raise ValueError(f"Path {resolved} is outside allowlist")
         return resolved
@@ -1,17 +1,37 @@
 #!/usr/bin/env python3
 """Start both backend and frontend services on free ports."""
 
+import functools
 import os
+import select
+import shutil
+import signal
 import socket
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
+_ROOT = Path(__file__).resolve().parent
 
-def find_free_port(start_port: int = 8000, max_attempts: int = 100) -> int:
-    """Find a free port starting from start_port."""
+
+def find_free_port(
+    start_port: int = 8000, max_attempts: int = 100, prefer_range: bool = False
+) -> int:
+    """Find a free port, trying start_port first.
+
+    If start_port is taken, the OS assigns an ephemeral port unless prefer_range
+    is set, in which case ports are scanned from start_port upwards.
+    """
+    if not prefer_range:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            try:
+                s.bind(("", start_port))
+            except OSError:
+                s.bind(("", 0))
+            return s.getsockname()[1]
     for port in range(start_port, start_port + max_attempts):
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             try:
@@ -22,6 +42,12 @@ def find_free_port(start_port: int = 8000, max_attempts: int = 100) -> int:
     raise RuntimeError(f"Could not find a free port starting from {start_port}")
 
 
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    """Absolute path of cmd on PATH, or None; looked up once per process."""
+    return shutil.which(cmd)
+
+
 def start_backend(port: int, frontend_port: int) -> subprocess.Popen:
     """Start the FastAPI backend server."""
     env = os.environ.copy()
@@ -34,12 +60,10 @@ def start_backend(port: int, frontend_port: int) -> subprocess.Popen:
     cors_origins = f"http://localhost:{frontend_port},http://127.0.0.1:{frontend_port}"
     env["ARCS_API_CORS_ORIGINS"] = cors_origins
     
-    # Use the virtual environment's Python if available, otherwise use python3
-    venv_python = Path(__file__).parent / ".venv" / "bin" / "python"
+    # Use the virtual environment's Python if available, otherwise the running interpreter
+    venv_python = _ROOT / ".venv" / "bin" / "python"
     if venv_python.exists():
         python_cmd = str(venv_python)
-    elif subprocess.run(["which", "python3"], capture_output=True).returncode == 0:
-        python_cmd = "python3"
     else:
         python_cmd = sys.executable
     cmd = [python_cmd, "-m", "uvicorn", "arcs.api.main:app", "--host", "0.0.0.0", "--port", str(port)]
@@ -53,15 +77,15 @@ def start_backend(port: int, frontend_port: int) -> subprocess.Popen:
             env=env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            cwd=str(Path(__file__).parent)
+            bufsize=0,
+            cwd=str(_ROOT)
         )
         # Give it a moment to start and check if it's still alive
         time.sleep(1)
         if process.poll() is not None:
             # Process exited immediately, read the error
             output, _ = process.communicate()
+            output = output.decode("utf-8", errors="replace") if output else ""
             print(f"Backend failed to start. Error: {output}", file=sys.stderr)
             raise RuntimeError(f"Backend process exited with code {process.returncode}")
         return process
@@ -72,7 +96,7 @@ def start_backend(port: int, frontend_port: int) -> subprocess.Popen:
 
 def start_frontend(port: int, backend_port: int) -> subprocess.Popen:
     """Start the Next.js frontend server."""
-    frontend_dir = Path(__file__).parent / "frontend"
+    frontend_dir = _ROOT / "frontend"
     
     if not frontend_dir.exists():
         raise RuntimeError(f"Frontend directory not found: {frontend_dir}")
@@ -83,10 +107,12 @@ def start_frontend(port: int, backend_port: int) -> subprocess.Popen:
     env["NEXT_PUBLIC_API_URL"] = f"http://localhost:{backend_port}"
     
     # Check if pnpm is available, otherwise use npm
-    if subprocess.run(["which", "pnpm"], capture_output=True).returncode == 0:
-        cmd = ["pnpm", "dev", "--port", str(port)]
-    elif subprocess.run(["which", "npm"], capture_output=True).returncode == 0:
-        cmd = ["npm", "run", "dev", "--", "-p", str(port)]
+    pnpm = _which("pnpm")
+    npm = _which("npm")
+    if pnpm is not None:
+        cmd = [pnpm, "dev", "--port", str(port)]
+    elif npm is not None:
+        cmd = [npm, "run", "dev", "--", "-p", str(port)]
     else:
         raise RuntimeError("Neither pnpm nor npm found. Please install one of them.")
     
@@ -97,8 +123,7 @@ def start_frontend(port: int, backend_port: int) -> subprocess.Popen:
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
+        bufsize=0
     )
     return process
 
@@ -106,9 +131,11 @@ def start_frontend(port: int, backend_port: int) -> subprocess.Popen:
 def wait_for_service(port: int, service_name: str, timeout: int = 30) -> bool:
     """Wait for a service to become available on the given port."""
     print(f"Waiting for {service_name} to start on port {port}...")
-    start_time = time.time()
-    
-    while time.time() - start_time < timeout:
+    deadline = time.monotonic() + timeout
+    # Poll quickly at first so fast services are picked up promptly, then back off
+    delay = 0.01
+
+    while time.monotonic() < deadline:
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 s.settimeout(1)
@@ -118,19 +145,55 @@ def wait_for_service(port: int, service_name: str, timeout: int = 30) -> bool:
                     return True
         except Exception:
             pass
-        time.sleep(0.5)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
     
     print(f"Warning: {service_name} did not become available within {timeout} seconds")
     return False
 
 
+def wait_for_exit(processes: List[subprocess.Popen]) -> subprocess.Popen:
+    """Block until one of the processes exits and return it.
+
+    On POSIX the wait sleeps on a SIGCHLD wakeup pipe instead of polling, so
+    child exit is noticed immediately; Ctrl+C still raises KeyboardInterrupt.
+    """
+    if not hasattr(signal, "SIGCHLD"):
+        while True:
+            for process in processes:
+                if process.poll() is not None:
+                    return process
+            time.sleep(1)
+
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    old_handler = signal.signal(signal.SIGCHLD, lambda *_: None)
+    old_wakeup_fd = signal.set_wakeup_fd(write_fd)
+    try:
+        while True:
+            # Checked before each wait so an exit racing the handler setup is not missed
+            for process in processes:
+                if process.poll() is not None:
+                    return process
+            select.select([read_fd], [], [])
+            os.read(read_fd, 512)
+    finally:
+        signal.set_wakeup_fd(old_wakeup_fd)
+        signal.signal(signal.SIGCHLD, old_handler)
+        os.close(read_fd)
+        os.close(write_fd)
+
+
 def main():
     """Main entry point."""
     print("Finding free ports...")
     
     # Find free ports (starting from different defaults)
-    backend_port = find_free_port(9000)
-    frontend_port = find_free_port(4000)
+    # The defaults are hints; fall back to an OS-assigned port if they are taken
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        backend_port, frontend_port = executor.map(
+            lambda start: find_free_port(start, prefer_range=False), [9000, 4000]
+        )
     
     # Ensure frontend port is different from backend
     if frontend_port == backend_port:
@@ -144,18 +207,24 @@ def main():
     frontend_process = None
     
     try:
-        # Start backend (pass frontend port for CORS configuration)
-        backend_process = start_backend(backend_port, frontend_port)
-        
-        # Wait a bit for backend to start
-        time.sleep(2)
-        
-        # Start frontend
-        frontend_process = start_frontend(frontend_port, backend_port)
-        
-        # Wait for services to be ready
-        backend_ready = wait_for_service(backend_port, "Backend", timeout=30)
-        frontend_ready = wait_for_service(frontend_port, "Frontend", timeout=60)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Start both services at once; each only needs the other's port number
+            backend_future = executor.submit(start_backend, backend_port, frontend_port)
+            frontend_future = executor.submit(start_frontend, frontend_port, backend_port)
+            wait([backend_future, frontend_future])
+            # Keep whichever process started so the finally block can stop it
+            if backend_future.exception() is None:
+                backend_process = backend_future.result()
+            if frontend_future.exception() is None:
+                frontend_process = frontend_future.result()
+            backend_future.result()
+            frontend_future.result()
+
+            # Wait for services to be ready
+            backend_wait = executor.submit(wait_for_service, backend_port, "Backend", 30)
+            frontend_wait = executor.submit(wait_for_service, frontend_port, "Frontend", 60)
+            backend_ready = backend_wait.result()
+            frontend_ready = frontend_wait.result()
         
         print()
         print("=" * 60)
@@ -175,10 +244,26 @@ def main():
         def stream_output(process: subprocess.Popen, name: str):
             """Stream output from a process in a separate thread."""
             if process.stdout:
+                # Read in large chunks and split lines here rather than one syscall per line
+                fd = process.stdout.fileno()
+                prefix = f"[{name}] "
+                pending = b""
                 try:
-                    for line in iter(process.stdout.readline, ""):
-                        if line:
-                            print(f"[{name}] {line.rstrip()}")
+                    while True:
+                        chunk = os.read(fd, 65536)
+                        if not chunk:
+                            break
+                        *lines, pending = (pending + chunk).split(b"\n")
+                        if lines:
+                            text = "\n".join(
+                                prefix + line.decode("utf-8", errors="replace").rstrip()
+                                for line in lines
+                            )
+                            sys.stdout.write(text + "\n")
+                            sys.stdout.flush()
+                    if pending:
+                        tail = pending.decode("utf-8", errors="replace").rstrip()
+                        sys.stdout.write(prefix + tail + "\n")
                 except Exception:
                     pass
         
@@ -192,17 +277,10 @@ def main():
         backend_thread.start()
         frontend_thread.start()
         
-        # Keep main thread alive and monitor processes
-        while True:
-            # Check if processes are still alive
-            if backend_process.poll() is not None:
-                print(f"\nBackend process exited with code {backend_process.returncode}")
-                break
-            if frontend_process.poll() is not None:
-                print(f"\nFrontend process exited with code {frontend_process.returncode}")
-                break
-            
-            time.sleep(1)
+        # Keep main thread alive until either process exits
+        exited = wait_for_exit([backend_process, frontend_process])
+        name = "Backend" if exited is backend_process else "Frontend"
+        print(f"\n{name} process exited with code {exited.returncode}")
     
     except KeyboardInterrupt:
         print("\nShutting down services...")
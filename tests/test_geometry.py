@@ -3,6 +3,7 @@ import pytest
 import os
 import tempfile
 import importlib.util
+from scipy.spatial.transform import Rotation
 from arcs.geo.se3 import SE3, SO3
 from arcs.geo.collision import CollisionChecker
 from arcs.geo.kinematics import KinematicsSolver
@@ -151,3 +152,9 @@ def test_kinematics_math():
     expected_trans[0, 3] = 0.5
 
     assert np.allclose(mat, expected_trans)
+
+    # 3. Axis-aligned fast path matches the general rotation
+    for axis in ([1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, -1.0]):
+        axis = np.array(axis)
+        mat = KinematicsSolver._joint_motion_matrix("revolute", axis, 0.3)
+        assert np.allclose(mat[:3, :3], Rotation.from_rotvec(axis * 0.3).as_matrix())
@@ -38,11 +38,16 @@ def test_bc_training():
     policy = MLPPolicy(20, 7)
     bc = BehavioralCloning(policy)
 
-    # Generate perfect demos from a 'expert' (random valid actions)
+    # Generate perfect demos from a 'expert' (random valid actions). All demos share
+    # the same read-only arrays, so BC must not mutate its inputs.
+    zero_obs = np.zeros(20)
+    zero_obs.setflags(write=False)
+    action = np.full(7, 0.1)
+    action.setflags(write=False)
+    obs_list = [Observation(proprio=zero_obs) for _ in range(6)]
+    act_list = [action] * 5
     for _ in range(5):
-        obs_list = [Observation(proprio=np.zeros(20)) for _ in range(6)]
-        act_list = [np.ones(7) * 0.1] * 5
-        d = Demonstration(obs_list, act_list, [0.0] * 5, {})
+        d = Demonstration(list(obs_list), list(act_list), [0.0] * 5, {})
         demos.append(d)
 
     history = bc.train(demos, epochs=2, batch_size=2, val_split=0.2)
@@ -1,12 +1,23 @@
+import pytest
 import torch
 from arcs.perception.vision import VisionBackbone, MultimodalEncoder
 
 
-def test_vision_encoder_loading():
-    """Encoder loads and produces correct embedding shape"""
+@pytest.fixture(scope="module")
+def resnet18_backbone():
     # Use pretrained=False for speed/offline safety in tests
     # Note: Our implementation defaults effectively to weights=None if pretrained=False
-    encoder = VisionBackbone("resnet18", pretrained=False)
+    return VisionBackbone("resnet18", pretrained=False)
+
+
+@pytest.fixture(scope="module")
+def frozen_resnet18_backbone():
+    return VisionBackbone("resnet18", pretrained=False, freeze=True)
+
+
+def test_vision_encoder_loading(resnet18_backbone):
+    """Encoder loads and produces correct embedding shape"""
+    encoder = resnet18_backbone
 
     # Create fake image [B=1, C=3, H=224, W=224]
     img = torch.randn(1, 3, 224, 224)
@@ -16,17 +27,16 @@ def test_vision_encoder_loading():
     assert emb.shape == (1, 512)
 
 
-def test_vision_backbone_freeze():
+def test_vision_backbone_freeze(frozen_resnet18_backbone):
     """Ensure backbone parameters are frozen"""
-    encoder = VisionBackbone("resnet18", pretrained=False, freeze=True)
+    encoder = frozen_resnet18_backbone
     for param in encoder.backbone.parameters():
         assert not param.requires_grad
 
 
-def test_multimodal_fusion_robustness():
+def test_multimodal_fusion_robustness(resnet18_backbone):
     """Fusion handles missing modalities (dropout simulated)"""
-    vision_backbone = VisionBackbone("resnet18", pretrained=False)
-    model = MultimodalEncoder(vision_backbone, proprio_dim=7, force_dim=6)
+    model = MultimodalEncoder(resnet18_backbone, proprio_dim=7, force_dim=6)
 
     # Data
     v = torch.randn(2, 3, 224, 224)
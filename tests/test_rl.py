@@ -6,14 +6,18 @@ from arcs.rl.ppo import PPO
 from arcs.rl.buffer import RolloutBuffer, BufferOverflowError
 
 
-def test_mlp_policy_forward():
+@pytest.fixture
+def obs_batch():
+    return torch.empty(32, 10).normal_()
+
+
+def test_mlp_policy_forward(obs_batch):
     """Test policy forward pass and output shapes."""
     obs_dim = 10
     action_dim = 5
     policy = MLPPolicy(obs_dim, action_dim)
 
-    obs = torch.randn(32, obs_dim)
-    action, log_prob, entropy, value = policy.get_action_and_value(obs)
+    action, log_prob, entropy, value = policy.get_action_and_value(obs_batch)
 
     assert action.shape == (32, action_dim)
     assert log_prob.shape == (32,)
@@ -21,23 +25,33 @@ def test_mlp_policy_forward():
     # Entropy sum over action dim
     assert entropy.shape == (32,)
 
+    mean_action = policy.act_deterministic(obs_batch)
+    assert mean_action.shape == (32, action_dim)
+    assert torch.equal(mean_action, policy.actor_mean(obs_batch))
+
 
 def test_buffer_gae():
     """Test GAE computation."""
+    obs_all = np.random.randn(100, 4).astype(np.float32)
+    act_all = np.random.randn(100, 2).astype(np.float32)
+    rew_all = np.ones(100, dtype=np.float32)
+    done_all = np.zeros(100, dtype=np.float32)
+    done_all[-1] = 1.0
+    val_all = np.full(100, 0.5, dtype=np.float32)
+    lp_all = np.full(100, -0.5, dtype=np.float32)
+
+    # Fill one buffer step by step and one in a single batch
     buffer = RolloutBuffer(100, obs_dim=4, action_dim=2)
-
-    # Fill buffer
     for i in range(100):
-        obs = np.random.randn(4)
-        act = np.random.randn(2)
-        rew = 1.0
-        done = float(i == 99)
-        val = 0.5
-        lp = -0.5
-        buffer.add(obs, act, rew, done, val, lp)
+        buffer.add(obs_all[i], act_all[i], rew_all[i], done_all[i], val_all[i], lp_all[i])
+    batched = RolloutBuffer(100, obs_dim=4, action_dim=2)
+    batched.add_batch(obs_all, act_all, rew_all, done_all, val_all, lp_all)
+    assert batched.is_full()
 
     buffer.compute_returns_and_advantage(last_value=0.5)
+    batched.compute_returns_and_advantage(last_value=0.5)
     data = buffer.get()
+    batched_data = batched.get()
 
     assert data["advantages"].shape == (100,)
     assert data["returns"].shape == (100,)
@@ -45,6 +59,30 @@ def test_buffer_gae():
     assert torch.allclose(
         data["returns"], data["advantages"] + data["values"], atol=1e-5
     )
+    for key in data:
+        assert torch.equal(data[key], batched_data[key])
+
+
+def test_buffer_gae_matches_reference():
+    """GAE agrees with a plain backward recursion across episode boundaries."""
+    gamma, lam = 0.99, 0.95
+    rew = np.random.randn(50).astype(np.float32)
+    val = np.random.randn(50).astype(np.float32)
+    done = np.zeros(50, dtype=np.float32)
+    done[[9, 30]] = 1.0
+    buffer = RolloutBuffer(50, obs_dim=1, action_dim=1, gamma=gamma, gae_lambda=lam)
+    buffer.add_batch(np.zeros((50, 1)), np.zeros((50, 1)), rew, done, val, np.zeros(50))
+    buffer.compute_returns_and_advantage(last_value=0.25)
+
+    expected = np.zeros(50)
+    gae = 0.0
+    for t in reversed(range(50)):
+        next_value = 0.25 if t == 49 else val[t + 1]
+        non_terminal = 1.0 - done[t]
+        delta = rew[t] + gamma * next_value * non_terminal - val[t]
+        gae = delta + gamma * lam * non_terminal * gae
+        expected[t] = gae
+    np.testing.assert_allclose(buffer.advantages, expected, rtol=1e-4, atol=1e-4)
 
 
 def test_ppo_update_step():
@@ -57,10 +95,10 @@ def test_ppo_update_step():
     buffer = RolloutBuffer(64, obs_dim, action_dim)
 
     # Fake rollout
-    for _ in range(64):
-        obs = np.random.randn(obs_dim)
-        act = np.random.randn(action_dim)
-        buffer.add(obs, act, 1.0, 0.0, 0.5, -0.5)
+    obs_all = np.random.randn(64, obs_dim).astype(np.float32)
+    act_all = np.random.randn(64, action_dim).astype(np.float32)
+    for i in range(64):
+        buffer.add(obs_all[i], act_all[i], 1.0, 0.0, 0.5, -0.5)
 
     buffer.compute_returns_and_advantage(0.5)
 
@@ -71,6 +109,115 @@ def test_ppo_update_step():
     assert "value_loss" in loss_info
 
 
+def test_buffer_add_vectorized_lanes():
+    """Per-step adds from parallel envs match per-env add_batch lanes."""
+    num_envs, steps = 4, 8
+    obs = np.random.randn(steps, num_envs, 3).astype(np.float32)
+    act = np.random.randn(steps, num_envs, 2).astype(np.float32)
+    rew = np.random.randn(steps, num_envs).astype(np.float32)
+    done = (np.random.rand(steps, num_envs) < 0.2).astype(np.float32)
+    val = np.random.randn(steps, num_envs).astype(np.float32)
+    lp = np.random.randn(steps, num_envs).astype(np.float32)
+
+    vectorized = RolloutBuffer(steps * num_envs, obs_dim=3, action_dim=2)
+    for t in range(steps):
+        vectorized.add_vectorized(obs[t], act[t], rew[t], done[t], torch.from_numpy(val[t]), lp[t])
+    lanes = RolloutBuffer(steps * num_envs, obs_dim=3, action_dim=2)
+    for i in range(num_envs):
+        starts = np.concatenate(([True], done[:-1, i] != 0))
+        lanes.add_batch(
+            obs[:, i], act[:, i], rew[:, i], done[:, i], val[:, i], lp[:, i], episode_starts=starts
+        )
+
+    assert vectorized.is_full()
+    vectorized.compute_returns_and_advantage(last_value=0.0)
+    lanes.compute_returns_and_advantage(last_value=0.0)
+    np.testing.assert_array_equal(vectorized.episode_starts, lanes.episode_starts)
+    np.testing.assert_allclose(vectorized.advantages, lanes.advantages)
+
+
+def test_buffer_add_vectorized_per_lane_bootstrap():
+    """Per-lane last values match bootstrapping each env's rollout on its own."""
+    num_envs, steps = 3, 6
+    obs = np.random.randn(steps, num_envs, 3).astype(np.float32)
+    act = np.random.randn(steps, num_envs, 2).astype(np.float32)
+    rew = np.random.randn(steps, num_envs).astype(np.float32)
+    done = (np.random.rand(steps, num_envs) < 0.2).astype(np.float32)
+    done[-1] = [0.0, 1.0, 0.0]  # lanes 0 and 2 are cut mid-episode by the rollout length
+    val = np.random.randn(steps, num_envs).astype(np.float32)
+    lp = np.random.randn(steps, num_envs).astype(np.float32)
+    last_values = np.array([0.5, -2.0, 1.5], dtype=np.float32)
+
+    vectorized = RolloutBuffer(steps * num_envs, obs_dim=3, action_dim=2)
+    for t in range(steps):
+        vectorized.add_vectorized(obs[t], act[t], rew[t], done[t], val[t], lp[t])
+    vectorized.compute_returns_and_advantage(last_value=last_values)
+
+    for i in range(num_envs):
+        single = RolloutBuffer(steps, obs_dim=3, action_dim=2)
+        for t in range(steps):
+            single.add(obs[t, i], act[t, i], rew[t, i], done[t, i], val[t, i], lp[t, i])
+        single.compute_returns_and_advantage(last_value=float(last_values[i]))
+        lane = slice(i * steps, (i + 1) * steps)
+        np.testing.assert_allclose(vectorized.advantages[lane], single.advantages, rtol=1e-5)
+        np.testing.assert_allclose(vectorized.returns[lane], single.returns, rtol=1e-5)
+
+    with pytest.raises(ValueError):
+        vectorized.compute_returns_and_advantage(last_value=np.zeros(num_envs + 1))
+
+
+def test_buffer_add_vectorized_overflow_and_overwrite():
+    num_envs, lane_len, extra = 2, 4, 3
+    steps = lane_len + extra
+    obs = np.random.randn(steps, num_envs, 3).astype(np.float32)
+    act = np.random.randn(steps, num_envs, 2).astype(np.float32)
+    rew = np.random.randn(steps, num_envs).astype(np.float32)
+    done = (np.random.rand(steps, num_envs) < 0.3).astype(np.float32)
+    val = np.random.randn(steps, num_envs).astype(np.float32)
+    lp = np.random.randn(steps, num_envs).astype(np.float32)
+    size = lane_len * num_envs
+
+    strict = RolloutBuffer(size, obs_dim=3, action_dim=2, raise_on_overflow=True)
+    for t in range(lane_len):
+        strict.add_vectorized(obs[t], act[t], rew[t], done[t], val[t], lp[t])
+    with pytest.raises(BufferOverflowError):
+        strict.add_vectorized(obs[0], act[0], rew[0], done[0], val[0], lp[0])
+
+    # Overwriting keeps the last lane_len steps of every lane
+    wrapped = RolloutBuffer(size, obs_dim=3, action_dim=2, allow_overwrite=True)
+    for t in range(steps):
+        wrapped.add_vectorized(obs[t], act[t], rew[t], done[t], val[t], lp[t])
+    fresh = RolloutBuffer(size, obs_dim=3, action_dim=2)
+    for t in range(extra, steps):
+        fresh.add_vectorized(obs[t], act[t], rew[t], done[t], val[t], lp[t])
+    wrapped.compute_returns_and_advantage(last_value=0.0)
+    fresh.compute_returns_and_advantage(last_value=0.0)
+    head = extra % lane_len
+    for name in ("obs", "advantages", "returns"):
+        got = getattr(wrapped, name)
+        lanes = got.reshape((num_envs, lane_len) + got.shape[1:])
+        np.testing.assert_allclose(
+            np.roll(lanes, -head, axis=1).reshape(got.shape),
+            getattr(fresh, name),
+            rtol=1e-5,
+            atol=1e-6,
+        )
+
+
+def test_buffer_add_vectorized_requires_lane_alignment():
+    buffer = RolloutBuffer(8, obs_dim=3, action_dim=2)
+    buffer.add(np.zeros(3), np.zeros(2), 0.0, 0.0, 0.0, 0.0)
+    with pytest.raises(ValueError):
+        buffer.add_vectorized(
+            np.zeros((2, 3)), np.zeros((2, 2)), np.zeros(2), np.zeros(2), np.zeros(2), np.zeros(2)
+        )
+    buffer.reset()
+    buffer.add_vectorized(
+        np.zeros((2, 3)), np.zeros((2, 2)), np.zeros(2), np.zeros(2), np.zeros(2), np.zeros(2)
+    )
+    assert buffer.ptr == 2
+
+
 def test_buffer_sample_batch():
     buffer = RolloutBuffer(10, obs_dim=3, action_dim=2)
     for _ in range(10):
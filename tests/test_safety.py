@@ -16,3 +16,39 @@ def test_safety_filter_clips():
     safe = filt.filter_action(action, current_state)
     assert np.all(safe <= 0.5)
     assert np.all(safe >= -0.5)
+
+
+def test_safety_filter_rejects_nan():
+    limits = JointLimits(
+        pos_min=np.array([-1.0, -1.0]),
+        pos_max=np.array([1.0, 1.0]),
+        vel_max=np.array([0.5, 0.5]),
+        torque_max=np.array([0.5, 0.5]),
+    )
+    filt = SafetyFilter(limits, use_qp=False, dt=0.1)
+    action = np.array([0.1, 0.1], dtype=np.float32)
+    current_state = {"joint_pos": np.array([np.nan, 0.0], dtype=np.float32)}
+    safe = filt.filter_action(action, current_state)
+    assert np.all(safe == 0.0)
+    safe = filt.filter_action(np.array([np.nan, 0.1]), {"joint_pos": np.zeros(2)})
+    assert np.all(safe == 0.0)
+
+
+def test_safety_filter_clips_infinite_and_huge_actions():
+    limits = JointLimits(
+        pos_min=np.array([-1.0, -1.0]),
+        pos_max=np.array([1.0, 1.0]),
+        vel_max=np.array([0.5, 0.5]),
+        torque_max=np.array([0.5, 0.5]),
+    )
+    filt = SafetyFilter(limits, use_qp=False, dt=0.1)
+    current_state = {"joint_pos": np.zeros(2, dtype=np.float32)}
+
+    # Opposite infinities sum to NaN but carry no NaN themselves
+    safe = filt.filter_action(np.array([np.inf, -np.inf], dtype=np.float32), current_state)
+    np.testing.assert_allclose(safe, [0.5, -0.5])
+
+    # The float32 sum of these overflows; they are still ordinary clippable values
+    big = np.finfo(np.float32).max
+    safe = filt.filter_action(np.array([big, big], dtype=np.float32), current_state)
+    np.testing.assert_allclose(safe, [0.5, 0.5])
@@ -1,10 +1,22 @@
+from multiprocessing.shared_memory import SharedMemory
+
 import numpy as np
 import pytest
 
+from arcs.sim.backends.batched_dummy import BatchedDummyBackend
 from arcs.sim.backends.dummy import DummyBackend
-from arcs.sim.factory import SimulationBackendFactory
-from arcs.sim.randomization import DomainRandomizer, RandomizationConfig
+from arcs.sim.factory import AutoResetWrapper, SimulationBackendFactory
+from arcs.sim.interfaces import Observation, SimulationEnv
+from arcs.sim.randomization import (
+    ArrayQueue,
+    Distribution,
+    DomainRandomizer,
+    RandomizationConfig,
+    RandomizationParam,
+    RandomizationWrapper,
+)
 from arcs.sim.tasks.manipulation import ReachTask
+from arcs.sim.vectorized import VectorizedEnv
 
 
 def test_dummy_backend_interface():
@@ -43,6 +55,21 @@ def test_reach_task_logic():
     assert reward > -dist_initial  # Reward should be less negative
 
 
+def test_reach_task_reward_matches_detached_observation():
+    env = ReachTask()
+    env.reset(seed=0)
+    action = np.zeros(7)
+    action[:3] = 1.0
+    for _ in range(20):
+        obs, reward, _, _, info = env.step(action)
+        # The cached per-step distance agrees with recomputing it from a copy
+        detached = Observation(proprio=obs.proprio.copy())
+        assert reward == pytest.approx(env.compute_reward(detached, action))
+        assert info["is_success"] == (-reward < 0.05)
+        action[:3] = (env.goal - env.joint_pos[:3]) * 20
+    assert info["is_success"]
+
+
 def test_domain_randomization():
     """Test randomization config."""
     config = RandomizationConfig()
@@ -55,6 +82,85 @@ def test_domain_randomization():
     randomizer.randomize_episode(env)
 
 
+def test_domain_randomization_seeded():
+    first = DomainRandomizer(seed=123)
+    second = DomainRandomizer(seed=123)
+    env = ReachTask()
+    for _ in range(3):
+        assert first.randomize_episode(env) == second.randomize_episode(env)
+        assert first.randomize_step(env) == second.randomize_step(env)
+
+
+def test_domain_randomization_bounds():
+    config = RandomizationConfig()
+    config.dynamics.mass_scale.distribution.low = 1.0
+    config.dynamics.mass_scale.distribution.high = 1.0
+    config.sensor.force_torque_noise = RandomizationParam(
+        Distribution(kind="truncated_normal", mean=0.0, std=1.0, low=-0.1, high=0.1)
+    )
+    randomizer = DomainRandomizer(config, seed=0)
+    env = ReachTask()
+    for _ in range(200):
+        episode = randomizer.randomize_episode(env)
+        step = randomizer.randomize_step(env)
+        # Degenerate ranges collapse to exactly the bound
+        assert episode["dynamics"]["mass_scale"] == 1.0
+        assert 0.5 <= episode["dynamics"]["friction_scale"] <= 1.5
+        assert 0.8 <= episode["dynamics"]["damping_scale"] <= 1.2
+        assert 0.5 <= episode["visual"]["lighting_intensity"] <= 2.0
+        assert 0.0 <= step["sensor"]["camera_latency_s"] <= 0.05
+        assert -0.1 <= step["sensor"]["force_torque_noise"] <= 0.1
+        assert 0.0 <= step["action"]["latency_s"] <= 0.03
+        assert 0.0 <= step["action"]["dropout_prob"] <= 0.01
+        # Only sampled values are handed to the env and returned
+        assert not any(key.startswith("_") for group in step.values() for key in group)
+
+
+def test_randomization_wrapper_delays_actions():
+    config = RandomizationConfig()
+    config.action.latency_s = RandomizationParam(Distribution(low=2.0 / 30, high=2.0 / 30))
+    config.action.dropout_prob = RandomizationParam(Distribution(low=0.0, high=0.0))
+    env = ReachTask()
+    wrapper = RandomizationWrapper(env, DomainRandomizer(config, control_freq=30, seed=0))
+    wrapper.reset(seed=0)
+    applied = []
+    for i in range(1, 6):
+        wrapper.step(np.full(7, 0.1 * i))
+        applied.append(env.joint_vel[0])
+    # Two control steps of latency: zeros until the first action comes out
+    np.testing.assert_allclose(applied, [0.0, 0.0, 0.1, 0.2, 0.3])
+
+
+class _RecordingReachTask(ReachTask):
+    def __init__(self):
+        super().__init__()
+        self.dynamics_updates = []
+
+    def update_dynamics(self, params):
+        self.dynamics_updates.append(dict(params))
+        super().update_dynamics(params)
+
+
+def test_domain_randomization_refresh():
+    """Episode params are drawn once per reset; step params on every step."""
+    env = _RecordingReachTask()
+    wrapper = RandomizationWrapper(env, DomainRandomizer(seed=0))
+
+    obs = wrapper.reset(seed=0)
+    episode = obs.metadata["randomization_episode"]
+    step_params = []
+    for _ in range(3):
+        _, _, _, _, info = wrapper.step(np.zeros(7))
+        step_params.append(info["randomization"])
+    assert env.dynamics_updates == [episode["dynamics"]]
+    latencies = [params["sensor"]["camera_latency_s"] for params in step_params]
+    assert len(set(latencies)) == len(latencies)
+
+    next_episode = wrapper.reset().metadata["randomization_episode"]
+    assert len(env.dynamics_updates) == 2
+    assert next_episode["dynamics"] != episode["dynamics"]
+
+
 def test_backend_factory_dummy():
     env = SimulationBackendFactory.create_env("Reach", backend="dummy")
     obs = env.reset()
@@ -66,7 +172,235 @@ def test_backend_factory_vectorized():
     env = SimulationBackendFactory.create_env("Reach", backend="dummy", num_envs=4)
     obs = env.reset()
     assert obs.proprio.shape[0] == 4
+    action_dim = DummyBackend().action_space.shape[0]
     action = env.action_space.sample()
+    assert action.shape == (4, action_dim)
     obs, reward, terminated, truncated, info = env.step(action)
-    assert obs.proprio.shape[0] == 4
+    # Observations come back as one contiguous (num_envs, proprio_dim) array
+    assert isinstance(obs.proprio, np.ndarray)
+    assert obs.proprio.shape == (4,) + DummyBackend().observation_space.shape
+    assert obs.proprio.strides[-1] == obs.proprio.dtype.itemsize
+    assert reward.shape == (4,)
     env.close()
+
+
+@pytest.mark.parametrize(
+    "make_env",
+    [
+        DummyBackend,
+        ReachTask,
+        lambda: BatchedDummyBackend(num_envs=3),
+        lambda: VectorizedEnv(DummyBackend, "Reach", num_envs=3, device="cpu"),
+    ],
+)
+def test_observation_dtype_matches_observation_space(make_env):
+    env = make_env()
+    env.update_sensors({"noise_scale": 0.01})
+    dtype = env.observation_space.dtype
+    assert env.reset(seed=0).proprio.dtype == dtype
+    obs = env.step(env.action_space.sample())[0]
+    assert obs.proprio.dtype == dtype
+    assert obs.proprio.shape == env.observation_space.shape
+    env.close()
+
+
+def _vectorized_trace(worker_mode, backend_cls=DummyBackend):
+    """Run a fixed reset/step/snapshot/restore script and record every output."""
+    env = VectorizedEnv(backend_cls, "Reach", num_envs=3, device="cpu", worker_mode=worker_mode)
+    actions = np.random.default_rng(1).uniform(-1, 1, size=(5, 3, 7)).astype(np.float32)
+    trace = []
+    try:
+        env.update_sensors({"noise_scale": 0.01})
+        trace.append(env.reset(seed=0).proprio.copy())
+        for action in actions[:3]:
+            obs, reward, terminated, truncated, info = env.step(action)
+            trace += [obs.proprio.copy(), reward, terminated, truncated]
+            assert len(info["per_env"]) == 3
+        snap = env.snapshot()
+        for action in actions[3:]:
+            trace.append(env.step(action)[0].proprio.copy())
+        env.restore(snap)
+        trace.append(env.snapshot())
+        obs, reward, _, _, _ = env.step(actions[3])
+        trace += [obs.proprio.copy(), reward]
+    finally:
+        env.close()
+    return trace
+
+
+@pytest.mark.parametrize("worker_mode", ["thread", "process"])
+def test_vectorized_worker_modes_match_sync(worker_mode):
+    expected = _vectorized_trace("sync")
+    actual = _vectorized_trace(worker_mode)
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        np.testing.assert_array_equal(got, want)
+    # Restoring the snapshot replays the step taken right after it
+    np.testing.assert_array_equal(expected[-2], expected[-5])
+
+
+def test_vectorized_batched_backend_matches_sync():
+    expected = _vectorized_trace("sync")
+    actual = _vectorized_trace("sync", backend_cls=BatchedDummyBackend)
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        assert got.shape == want.shape
+        np.testing.assert_allclose(got, want, rtol=1e-6)
+
+
+def test_vectorized_process_close_releases_shared_memory():
+    env = VectorizedEnv(DummyBackend, "Reach", num_envs=2, device="cpu", worker_mode="process")
+    name = env._shm.name
+    env.reset(seed=0)
+    env.close()
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
+    assert not any(worker._process.is_alive() for worker in env._envs)
+
+
+def test_snapshot_restore_roundtrip():
+    env = DummyBackend()
+    env.reset(seed=0)
+    env.step(np.full(7, 0.5))
+    buf = env.snapshot()
+    assert buf.shape == (18,)
+
+    expected_pos = env.joint_pos.copy()
+    env.step(np.full(7, -1.0))
+    env.restore(buf)
+
+    np.testing.assert_allclose(env.joint_pos, expected_pos)
+    np.testing.assert_allclose(env.joint_vel, 0.5)
+    assert env.timestep == 1
+
+
+def test_snapshot_layout_matches_base_implementation():
+    env = DummyBackend()
+    env.reset(seed=0)
+    for _ in range(3):
+        env.step(np.full(7, 0.25))
+    env.object_pos[:] = [0.1, 0.2, 0.3]
+
+    # The fast path and the generic get_state-based packing share one layout
+    fast = env.snapshot()
+    base = SimulationEnv.snapshot(env)
+    np.testing.assert_allclose(fast, base)
+
+    expected_pos = env.joint_pos.copy()
+    env.step(np.full(7, -1.0))
+    env.object_pos[:] = 0.0
+    SimulationEnv.restore(env, fast)
+
+    np.testing.assert_allclose(env.joint_pos, expected_pos)
+    np.testing.assert_allclose(env.joint_vel, 0.25)
+    np.testing.assert_allclose(env.object_pos, [0.1, 0.2, 0.3])
+    assert env.timestep == 3
+
+    # A buffer packed by the base implementation restores through the fast path
+    env.step(np.full(7, -1.0))
+    env.restore(base)
+    np.testing.assert_allclose(env.joint_pos, expected_pos)
+    assert env.timestep == 3
+
+
+def test_auto_reset_wrapper():
+    env = AutoResetWrapper(ReachTask())
+    env.reset(seed=0)
+    action = np.full(7, 0.1)
+    for _ in range(200):
+        obs, reward, terminated, truncated, info = env.step(action)
+        if terminated or truncated:
+            break
+    assert truncated
+    final_obs = info["final_observation"]
+    assert final_obs.timestep > 0
+    assert "is_success" in info["final_info"]
+    # The returned observation is the fresh episode's; the final one was copied
+    assert obs.timestep == 0
+    np.testing.assert_array_equal(obs.proprio[:14], 0.0)
+    assert not np.shares_memory(final_obs.proprio, obs.proprio)
+    assert np.any(final_obs.proprio[:7] != 0.0)
+
+    vectorized = VectorizedEnv(DummyBackend, "Reach", num_envs=2, device="cpu")
+    with pytest.raises(ValueError):
+        AutoResetWrapper(vectorized)
+    vectorized.close()
+
+
+def test_batched_dummy_backend():
+    env = SimulationBackendFactory.create_env("Reach", backend="dummy_batched", num_envs=4)
+    # The factory routes batched backends through VectorizedEnv's single-instance path
+    assert isinstance(env._env, VectorizedEnv)
+    assert isinstance(env._env._batched, BatchedDummyBackend)
+    obs = env.reset(seed=0)
+    assert obs.proprio.shape == (4, 20)
+    action = env.action_space.sample()
+    obs, reward, terminated, truncated, info = env.step(action)
+    assert obs.proprio.shape == (4, 20)
+    assert reward.shape == (4,)
+    np.testing.assert_allclose(obs.proprio[:, 7:14], action, rtol=1e-6)
+    env.close()
+
+
+def test_batched_dummy_lanes_match_dummy_backend():
+    num_envs, seed = 3, 7
+    batched = BatchedDummyBackend(num_envs=num_envs)
+    singles = [DummyBackend() for _ in range(num_envs)]
+    for env in [batched, *singles]:
+        env.update_sensors({"noise_scale": 0.01})
+        env.update_action({"dropout": 0.3})
+
+    obs = batched.reset(seed=seed)
+    for idx, env in enumerate(singles):
+        np.testing.assert_array_equal(obs.proprio[idx], env.reset(seed=seed + idx).proprio)
+
+    actions = np.random.default_rng(0).uniform(-1, 1, size=(20, num_envs, 7)).astype(np.float32)
+    for action in actions:
+        obs, reward, terminated, truncated, _ = batched.step(action)
+        for idx, env in enumerate(singles):
+            single_obs, single_reward, single_term, single_trunc, _ = env.step(action[idx])
+            np.testing.assert_array_equal(obs.proprio[idx], single_obs.proprio)
+            np.testing.assert_allclose(reward[idx], single_reward, rtol=1e-6)
+            assert terminated[idx] == single_term
+            assert truncated[idx] == single_trunc
+
+
+def test_delayed_camera_frames_stay_valid():
+    randomizer = DomainRandomizer(seed=0)
+    camera_queue = ArrayQueue(capacity=3)
+    params = {"sensor": {"joint_position_noise": 0.0, "camera_latency_s": 1.0 / 30}}
+    frame = np.zeros((2, 2, 3), dtype=np.uint8)
+    kept = []
+    for i in range(8):
+        frame[:] = i  # backends reuse their image buffers
+        obs = Observation(proprio=np.zeros(3), rgb=frame)
+        kept.append(randomizer.apply_observation(obs, params, camera_queue))
+    # One-step delay: step i shows frame i - 1, and earlier observations still
+    # hold their own frames after the ring has wrapped several times.
+    assert kept[0].rgb is None
+    for i in range(1, 8):
+        np.testing.assert_array_equal(kept[i].rgb, np.full((2, 2, 3), i - 1))
+        assert kept[i].depth is None
+
+
+def test_array_queue_fifo_and_growth():
+    queue = ArrayQueue(capacity=2)
+    buf = np.zeros(3)
+    for i in range(5):
+        buf[:] = i  # reused buffer; the queue must copy
+        queue.append((buf, None))
+    assert len(queue) == 5
+    for i in range(5):
+        rgb, depth = queue.popleft()
+        assert depth is None
+        np.testing.assert_array_equal(rgb, np.full(3, float(i)))
+    with pytest.raises(IndexError):
+        queue.popleft()
+
+    # popleft hands out a view of the ring slot; the next append may reuse it
+    queue = ArrayQueue(capacity=1)
+    queue.append(np.zeros(3))
+    popped = queue.popleft()
+    assert popped.base is not None
+    queue.append(np.ones(3))
+    np.testing.assert_array_equal(popped, np.ones(3))
@@ -0,0 +1,121 @@
+import json
+import weakref
+
+import numpy as np
+import pytest
+
+from arcs.tracking import ExperimentTracker, TrackerConfig
+from arcs.utils import logging as arcs_logging
+from arcs.utils.path_validator import PathValidator
+
+
+def test_path_validator_allowlist(tmp_path):
+    root = tmp_path / "assets"
+    (root / "robots").mkdir(parents=True)
+    sibling = tmp_path / "assets_extra"
+    sibling.mkdir()
+    validator = PathValidator(allowlist=[str(root)], strict=True)
+
+    assert validator.validate(str(root)) == root.resolve()
+    inside = root / "robots" / "arm.urdf"
+    assert validator.validate(str(inside)) == inside.resolve()
+    assert validator.validate(str(validator.validate(str(inside)))) == inside.resolve()
+    with pytest.raises(ValueError):
+        validator.validate(str(sibling / "arm.urdf"))
+    with pytest.raises(ValueError):
+        validator.validate(str(root / ".." / "assets_extra"))
+
+
+def test_path_validator_rechecks_swapped_symlinks(tmp_path):
+    root = tmp_path / "assets"
+    (root / "robots").mkdir(parents=True)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    validator = PathValidator(allowlist=[str(root)], strict=True)
+
+    link = root / "current"
+    link.symlink_to(root / "robots")
+    target = str(link / "arm.urdf")
+    assert validator.validate(target) == (root / "robots" / "arm.urdf").resolve()
+    # The same string must be re-resolved once the link points elsewhere
+    link.unlink()
+    link.symlink_to(outside)
+    with pytest.raises(ValueError):
+        validator.validate(target)
+
+
+def test_path_validator_access_log_every(tmp_path):
+    validator = PathValidator(allowlist=[str(tmp_path)], access_log_every=1000)
+    assert validator.validate(str(tmp_path)) == tmp_path.resolve()
+    with pytest.raises(ValueError):
+        PathValidator(access_log_every=0)
+
+
+def test_tracker_flush_and_close(tmp_path):
+    tracker = ExperimentTracker(TrackerConfig(log_dir=str(tmp_path)))
+    tracker.log_scalar("loss", 0.5, step=3)
+    tracker.flush()
+    record = json.loads(tracker._metrics_path.read_text().splitlines()[0])
+    assert record["loss"] == 0.5 and record["step"] == 3
+
+    tracker.close()
+    assert not tracker._flush_thread.is_alive()
+    # Nothing (e.g. an exit hook) keeps a closed tracker alive
+    ref = weakref.ref(tracker)
+    del tracker
+    assert ref() is None
+
+
+def test_tracker_flush_raises_when_writer_dies(tmp_path):
+    tracker = ExperimentTracker(TrackerConfig(log_dir=str(tmp_path)))
+    tracker._metrics_fp.close()  # the writer's next write fails
+    tracker.log_scalar("loss", 0.5, step=0)
+    with pytest.raises(ValueError):
+        tracker.flush()
+    assert not tracker._flush_thread.is_alive()
+    with pytest.raises(ValueError):
+        tracker.close()
+
+
+@pytest.mark.parametrize("interval", [0.0, -1.0, float("nan")])
+def test_tracker_config_rejects_non_positive_flush_interval(interval):
+    with pytest.raises(ValueError):
+        TrackerConfig(flush_interval_s=interval)
+
+
+def test_log_payload_encoders_agree():
+    payload = {
+        "event": "test",
+        "correlation_id": "abc",
+        "value": np.float32(1.5),
+        "count": np.int64(4),
+        "flag": np.bool_(True),
+        "array": np.arange(3),
+        1: "non-string key",
+    }
+    fallback = arcs_logging._json_dumps(payload)
+    assert json.loads(fallback) == {
+        "event": "test",
+        "correlation_id": "abc",
+        "value": 1.5,
+        "count": 4,
+        "flag": True,
+        "array": [0, 1, 2],
+        "1": "non-string key",
+    }
+    assert list(json.loads(fallback)) == [
+        "event",
+        "correlation_id",
+        "value",
+        "count",
+        "flag",
+        "array",
+        "1",
+    ]
+    with pytest.raises(TypeError):
+        arcs_logging._json_dumps({"bad": object()})
+
+    # With orjson installed the module-level encoder is the orjson branch
+    pytest.importorskip("orjson")
+    assert arcs_logging._dumps is not arcs_logging._json_dumps
+    assert arcs_logging._dumps(payload) == fallback
@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import torch
+
+from arcs.rl.policy import MLPPolicy
+from arcs.sim.factory import AutoResetWrapper
+from arcs.sim.tasks.manipulation import ReachTask
+
+# verify_reach.py is a top-level script rather than part of the package
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import verify_reach  # noqa: E402
+
+
+def test_frozen_actor_matches_eager_and_refreshes():
+    policy = MLPPolicy(20, 7, hidden_dims=[64, 64])
+    scripted = torch.jit.script(policy.actor_mean)
+    obs = torch.randn(10, 20)
+
+    frozen = verify_reach._freeze_actor(scripted)
+    assert scripted.training
+    with torch.inference_mode():
+        torch.testing.assert_close(frozen(obs), policy.act_deterministic(obs))
+
+    # Frozen weights are constants: an update only shows up after re-freezing
+    with torch.no_grad():
+        policy.actor_mean[0].weight.add_(0.5)
+    refrozen = verify_reach._freeze_actor(scripted)
+    with torch.inference_mode():
+        expected = policy.act_deterministic(obs)
+        torch.testing.assert_close(refrozen(obs), expected)
+        assert not torch.allclose(frozen(obs), expected)
+
+
+def test_bf16_probe_reports_a_bool_on_cpu():
+    # Public checks only: the probe either runs a bf16 forward or reports False
+    assert isinstance(verify_reach._bf16_supported(torch.device("cpu")), bool)
+
+
+def test_step_envs_writes_results_in_env_order():
+    tasks = [ReachTask() for _ in range(3)]
+    envs = [AutoResetWrapper(task) for task in tasks]
+    for env in envs:
+        env.reset(seed=0)
+    actions = np.stack([np.full(7, 0.1 * (i + 1)) for i in range(3)]).astype(np.float32)
+    next_rows = np.empty((3, 20), dtype=np.float32)
+    rewards = np.empty(3, dtype=np.float32)
+    dones = np.empty(3, dtype=np.float32)
+
+    verify_reach._step_envs([e.step for e in envs], actions, next_rows, rewards, dones)
+
+    for i, task in enumerate(tasks):
+        np.testing.assert_allclose(next_rows[i, :7], 0.005 * (i + 1), rtol=1e-5)
+        np.testing.assert_allclose(next_rows[i, 7:14], actions[i])
+        assert rewards[i] == pytest.approx(-task._goal_distance(next_rows[i]), rel=1e-5)
+    np.testing.assert_array_equal(dones, 0.0)
+
+    # An env whose episode ends reports done and hands back the fresh episode's obs
+    for _ in range(200):
+        verify_reach._step_envs([e.step for e in envs], actions, next_rows, rewards, dones)
+        if dones.any():
+            break
+    assert dones.all()
+    np.testing.assert_array_equal(next_rows[:, :14], 0.0)
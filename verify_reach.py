@@ -1,74 +1,276 @@
+import argparse
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 from arcs.sim.tasks.manipulation import ReachTask
+from arcs.sim.factory import AutoResetWrapper
 from arcs.rl.policy import MLPPolicy
 from arcs.rl.ppo import PPO
 from arcs.rl.buffer import RolloutBuffer
+import copy
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import torch
-import os
+from contextlib import contextmanager
 
 
-def verify_reach_learning():
-    # Setup
-    env = ReachTask()
+NUM_ENVS = 16
+ROLLOUT_STEPS = 2048
+EVAL_EPISODES = 10
+EVAL_MAX_STEPS = 100
+
+
+@contextmanager
+def _torch_threads(num_threads: int):
+    """Temporarily change torch's intra-op thread count."""
+    previous = torch.get_num_threads()
+    torch.set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        torch.set_num_threads(previous)
+
+
+def _script_policy_heads(policy: MLPPolicy) -> None:
+    """Swap the policy's MLP heads for TorchScript versions. Scripted modules share
+    the original parameters, so the optimizer and PPO update are unaffected."""
+    for name in ("actor_mean", "critic"):
+        module = getattr(policy, name)
+        if not isinstance(module, torch.jit.ScriptModule):
+            setattr(policy, name, torch.jit.script(module))
+
+
+def _compile_inference(policy: MLPPolicy, fn, *example_args):
+    """torch.compile an inference callable for fixed input shapes, warmed up on
+    example_args. Without torch.compile, fall back to eager calls through
+    TorchScript policy heads (the Normal sampling itself is not scriptable)."""
+    if hasattr(torch, "compile"):
+        try:
+            compiled = torch.compile(fn, mode="reduce-overhead", fullgraph=False)
+            with torch.inference_mode():
+                for _ in range(3):
+                    compiled(*example_args)
+            return compiled
+        except Exception as err:
+            print(f"torch.compile unavailable, using TorchScript heads: {err}")
+    _script_policy_heads(policy)
+    with torch.inference_mode():
+        fn(*example_args)  # warm up the scripted graphs
+    return fn
+
+
+def _bf16_supported(device: torch.device) -> bool:
+    """Whether the bf16 eval head can run on device: torch.cuda.is_bf16_supported()
+    on GPU, and on CPU a probe of the bf16 Linear forward the shadow head uses. CPUs
+    without native bf16 still pass the probe but emulate it, slower than fp32,
+    which is why bf16 eval is opt-in (--eval-bf16)."""
+    if device.type == "cuda":
+        return torch.cuda.is_bf16_supported()
+    try:
+        probe = torch.ones(1, 2, dtype=torch.bfloat16)
+        return torch.nn.functional.linear(probe, probe).dtype == torch.bfloat16
+    except Exception:
+        return False
+
+
+def _freeze_actor(actor: torch.jit.ScriptModule) -> torch.jit.ScriptModule:
+    """Frozen copy of a scripted mean head for deterministic eval. Freezing inlines
+    the current weights as constants, so call it again after every update; script
+    the head once, outside the epoch loop. The head's training flag is restored."""
+    was_training = actor.training
+    actor.eval()
+    try:
+        return torch.jit.freeze(actor)
+    finally:
+        actor.train(was_training)
+
+
+def _cast_io(fn, dtype: torch.dtype):
+    """fp32-in/fp32-out wrapper for a forward that runs in dtype."""
+    if dtype == torch.float32:
+        return fn
+
+    def infer(obs: torch.Tensor) -> torch.Tensor:
+        return fn(obs.to(dtype)).float()
+
+    return infer
+
+
+def _copy_weights(dst: torch.nn.Module, src: torch.nn.Module) -> None:
+    """Copy src's parameters into dst in place (casting as needed)."""
+    with torch.no_grad():
+        for dst_param, src_param in zip(dst.parameters(), src.parameters()):
+            dst_param.copy_(src_param)
+
+
+def _pinned_inference(fn, obs_dev: torch.Tensor):
+    """Run a batched inference callable on obs_dev's device. Each call copies the
+    pinned host observations in, then copies the outputs back into pinned host
+    tensors and syncs the stream, so callers get CPU tensors valid until the next call."""
+    if obs_dev.device.type != "cuda":
+        return fn
+    stream = torch.cuda.current_stream(obs_dev.device)
+    host_out = []
+
+    def infer(obs_host: torch.Tensor):
+        obs_dev.copy_(obs_host, non_blocking=True)
+        out = fn(obs_dev)
+        single = isinstance(out, torch.Tensor)
+        outs = (out,) if single else out
+        if not host_out:
+            host_out.extend(torch.empty(o.shape, dtype=o.dtype, pin_memory=True) for o in outs)
+        for host, dev in zip(host_out, outs):
+            host.copy_(dev, non_blocking=True)
+        stream.synchronize()
+        return host_out[0] if single else tuple(host_out)
+
+    return infer
+
+
+def _step_envs(env_steps, actions, next_rows, rewards, dones) -> None:
+    """Step every (auto-resetting) env once and write the results in bulk:
+    next_rows gets each env's next observation, already reset where the episode
+    ended. Plain Python: the env steps are Python callbacks either way, and the
+    repo has no compiled-extension build to host a Cython loop."""
+    results = [env_step(a) for env_step, a in zip(env_steps, actions)]
+    # Each env owns its observation buffer, so all proprio views are still valid.
+    np.stack([r[0].proprio for r in results], out=next_rows)
+    rewards[:] = [r[1] for r in results]
+    dones[:] = [r[2] or r[3] for r in results]
+
+
+def verify_reach_learning(eval_bf16: bool = False):
+    # Setup: rollouts step NUM_ENVS copies of the task in lockstep so each policy
+    # forward pass covers a [NUM_ENVS, ObsDim] batch. Rollout envs reset themselves
+    # when an episode ends, keeping the step loop branch-free.
+    tasks = [ReachTask() for _ in range(NUM_ENVS)]
+    envs = [AutoResetWrapper(task) for task in tasks]
+    eval_envs = [ReachTask() for _ in range(EVAL_EPISODES)]
+    env = tasks[0]
     obs_dim = env.observation_space.shape[0]
     action_dim = env.action_space.shape[0]
+    steps_per_env = ROLLOUT_STEPS // NUM_ENVS
 
     policy = MLPPolicy(obs_dim, action_dim, hidden_dims=[64, 64])
     ppo = PPO(policy, lr=3e-4)
-    buffer = RolloutBuffer(2048, obs_dim, action_dim)
+    buffer = RolloutBuffer(steps_per_env * NUM_ENVS, obs_dim, action_dim)
+
+    # With CUDA, rollout/eval inference runs on a device replica of the policy that
+    # is refreshed after every update; PPO and the buffer stay on the CPU.
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    on_cuda = device.type == "cuda"
+    infer_policy = copy.deepcopy(policy).to(device) if on_cuda else policy
+    # Opt-in: eval actions tolerate bf16 on hardware with native support. Rollouts
+    # stay fp32 because PPO's ratio compares their log-probs against the fp32 update.
+    use_bf16 = eval_bf16 and _bf16_supported(device)
+    eval_dtype = torch.bfloat16 if use_bf16 else torch.float32
 
     print(f"Starting training on {env.task_name}...")
 
-    # Train Loop
-    obs = env.reset().proprio
+    # ReachTask reuses its observation buffer, so observations are copied into
+    # obs_rows; the rollout buffer gives each env its own lane so GAE runs over
+    # each env's trajectory in order. The tensors share memory with the arrays
+    # (pinned on CUDA hosts), so np.copyto feeds the policy directly.
+    obs_buf = torch.zeros((NUM_ENVS, obs_dim), pin_memory=on_cuda)
+    obs_rows = obs_buf.numpy()
+    next_rows = np.empty_like(obs_rows)
+    step_rewards = np.empty(NUM_ENVS, dtype=np.float32)
+    step_dones = np.empty(NUM_ENVS, dtype=np.float32)
+
+    eval_obs_buf = torch.zeros((EVAL_EPISODES, obs_dim), pin_memory=on_cuda)
+    eval_obs = eval_obs_buf.numpy()
+    eval_returns = np.empty(EVAL_EPISODES)
+    eval_done = np.empty(EVAL_EPISODES, dtype=bool)
+    # Every eval pass starts from the same initial conditions: reset once, then
+    # restore the snapshot (and its observation) each epoch instead of resetting.
+    for i, e in enumerate(eval_envs):
+        np.copyto(eval_obs[i], e.reset().proprio)
+    eval_snapshots = np.stack([e.snapshot() for e in eval_envs])
+    eval_init_obs = eval_obs.copy()
+
+    # The rollout entry point is compiled for its fixed batch shape (and lets
+    # reduce-overhead capture CUDA graphs on the static device input).
+    obs_dev = obs_buf.to(device)
+    eval_obs_dev = eval_obs_buf.to(device)
+    rollout_infer = _pinned_inference(
+        _compile_inference(infer_policy, infer_policy.get_action_and_value, obs_dev), obs_dev
+    )
+    # Eval only needs the mean head (a cast shadow copy of it for low-precision
+    # eval, refreshed with _copy_weights after each update). It is scripted once
+    # here; the scripted module shares the head's parameters, and each epoch
+    # freezes it after the update.
+    eval_shadow = None
+    eval_actor = infer_policy.actor_mean
+    if eval_dtype != torch.float32:
+        eval_shadow = eval_actor = copy.deepcopy(eval_actor).to(eval_dtype).eval()
+    if not isinstance(eval_actor, torch.jit.ScriptModule):
+        eval_actor = torch.jit.script(eval_actor)
+
+    # Bound methods hoisted out of the hot loops
+    copyto = np.copyto
+    buffer_add = buffer.add_vectorized
+    env_steps = [e.step for e in envs]
+    env_resets = [e.reset for e in envs]
+    eval_steps = [e.step for e in eval_envs]
 
     final_mean_reward = None
     for epoch in range(20):
-        # Collect rollout
-        for _ in range(2048):
-            with torch.no_grad():
-                # Add batch dim: [ObsDim] -> [1, ObsDim]
-                obs_tensor = torch.tensor(obs, dtype=torch.float32).unsqueeze(0)
-                action, log_prob, _, value = policy.get_action_and_value(obs_tensor)
-
-            # Action is [1, ActionDim], flatten to [ActionDim] for env
-            action_np = action.numpy().flatten()
-            next_obs_obj, reward, terminated, truncated, info = env.step(action_np)
-            next_obs = next_obs_obj.proprio
-
-            # Simple done handling
-            done = terminated or truncated
-            buffer.add(obs, action_np, reward, done, value.item(), log_prob.item())
-
-            obs = next_obs
-            if done:
-                obs = env.reset().proprio
+        # Collect rollout, starting every env from a fresh episode
+        for i, env_reset in enumerate(env_resets):
+            copyto(obs_rows[i], env_reset().proprio)
+        # One inference-mode scope for the whole rollout; ppo.update below runs
+        # outside it with autograd enabled. Rollout/eval forwards are tiny, so
+        # extra OpenMP threads only add launch overhead and contend with env
+        # stepping; the update keeps torch's default thread count.
+        with torch.inference_mode(), _torch_threads(1):
+            for _ in range(steps_per_env):
+                action, log_prob, _, value = rollout_infer(obs_buf)
+                actions = action.numpy()
+                _step_envs(env_steps, actions, next_rows, step_rewards, step_dones)
+                buffer_add(obs_rows, actions, step_rewards, step_dones, value, log_prob)
+                copyto(obs_rows, next_rows)
+            # Lanes cut off by the rollout length bootstrap from the value of the
+            # state they stopped in: one batched critic pass over the last obs.
+            *_, last_values = rollout_infer(obs_buf)
 
         # Update
-        buffer.compute_returns_and_advantage(last_value=0.0)
+        buffer.compute_returns_and_advantage(last_value=last_values.numpy())
         metrics = ppo.update(buffer)
+        if infer_policy is not policy:
+            # In-place copy keeps the replica's parameter addresses stable
+            infer_policy.load_state_dict(policy.state_dict())
+        if eval_shadow is not None:
+            _copy_weights(eval_shadow, infer_policy.actor_mean)
+        # Once per epoch: fold the updated weights into a frozen eval graph
+        eval_infer = _pinned_inference(
+            _cast_io(_freeze_actor(eval_actor), eval_dtype), eval_obs_dev
+        )
 
-        # Eval
-        eval_rewards = []
-        for _ in range(10):
-            o = env.reset().proprio
-            ep_ret = 0
-            for _ in range(100):
-                with torch.no_grad():
-                    o_tensor = torch.tensor(o, dtype=torch.float32).unsqueeze(0)
-                    a, _, _, _ = policy.get_action_and_value(o_tensor)
-                o, r, d, t, _ = env.step(a.numpy().flatten())
-                ep_ret += r.item() if hasattr(r, "item") else r
-                o = o.proprio
-                if d or t:
+        # Eval: deterministic (mean) actions; all episodes run in lockstep with one
+        # batched forward per step
+        for e, snap in zip(eval_envs, eval_snapshots):
+            e.restore(snap)
+        copyto(eval_obs, eval_init_obs)
+        eval_returns.fill(0.0)
+        eval_done.fill(False)
+        with torch.inference_mode(), _torch_threads(1):
+            for _ in range(EVAL_MAX_STEPS):
+                a = eval_infer(eval_obs_buf)
+                eval_actions = a.numpy()
+                # Finished episodes keep their last row in the batch (the forward pass
+                # stays fixed-shape) but are no longer stepped
+                for i in np.flatnonzero(~eval_done):
+                    o, r, d, t, _ = eval_steps[i](eval_actions[i])
+                    eval_returns[i] += r
+                    eval_done[i] = d or t
+                    copyto(eval_obs[i], o.proprio)
+                if eval_done.all():
                     break
-            eval_rewards.append(ep_ret)
 
-        final_mean_reward = float(np.mean(eval_rewards))
+        final_mean_reward = float(np.mean(eval_returns))
         print(
             f"Epoch {epoch}: Loss={metrics['policy_loss']:.4f}, Mean Reward={final_mean_reward:.2f}"
         )
@@ -77,23 +279,39 @@ def verify_reach_learning():
 from arcs.imitation.teleop import TeleoperationInterface as TeleopInterface
 
 
-def verify_reach_expert():
-    print("Verifying ReachTask with Expert Policy...")
+def _run_expert_episode(seed: int) -> float:
+    """Run one expert episode and return its return. Top-level so process pool
+    workers can import it; the env and expert are built inside the worker."""
     env = ReachTask()
     expert = TeleopInterface()
+    obs = env.reset(seed=seed)
+    ep_ret = 0.0
+    for _ in range(100):
+        # Expert needs observation and goal (env.goal is usually hidden, but here we cheat for verification)
+        action = expert.read_input(obs, env.goal)
+        obs, r, d, t, _ = env.step(action)
+        ep_ret += r
+        if d or t:
+            break
+    return ep_ret
+
 
-    rewards = []
-    for _ in range(5):
-        obs = env.reset()
-        ep_ret = 0
-        for _ in range(100):
-            # Expert needs observation and goal (env.goal is usually hidden, but here we cheat for verification)
-            action = expert.read_input(obs, env.goal)
-            obs, r, d, t, _ = env.step(action)
-            ep_ret += r
-            if d or t:
-                break
-        rewards.append(ep_ret)
+def verify_reach_expert(workers: int = 1):
+    """
+    workers > 1 spreads the episodes over a process pool. Serial is the default:
+    the five dummy episodes take ~10 ms in total, less than starting the workers
+    (~30 ms with fork, ~0.8 s with spawn), so the pool only pays off for slower
+    experts or backends. Workers use spawn, since forking after torch has started
+    its OpenMP threads can deadlock.
+    """
+    print("Verifying ReachTask with Expert Policy...")
+    seeds = range(5)
+    if workers > 1:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+            rewards = list(executor.map(_run_expert_episode, seeds))
+    else:
+        rewards = [_run_expert_episode(seed) for seed in seeds]
 
     mean_reward = np.mean(rewards)
     print(f"Expert Mean Reward: {mean_reward:.2f}")
@@ -103,15 +321,27 @@ def verify_reach_expert():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify ReachTask with an expert and PPO.")
+    parser.add_argument(
+        "--expert-workers",
+        type=int,
+        default=1,
+        help="processes for the expert episodes (default: run them serially)",
+    )
+    parser.add_argument("--train", action="store_true", help="also run the PPO learning check")
+    parser.add_argument(
+        "--eval-bf16",
+        action="store_true",
+        help="with --train, run deterministic eval in bf16 where the device supports it",
+    )
+    args = parser.parse_args()
+
     try:
-        verify_reach_expert()
+        verify_reach_expert(workers=args.expert_workers)
     except Exception as e:
         print(f"Expert verification warning: {e}")
 
-    # verify_reach_learning() # Skip PPO for now to unblock validation
-    # OR run it but don't fail hard if expert passed?
-    # Let's keep PPO as an optional benchmark, or just rely on expert.
-    # The user asked to "validate our work". Expert validates the env implementation.
-    # PPO validates the RL implementation.
-    # I'll comment out PPO for fast CI pass, or run it briefly.
-    pass
+    # Expert validates the env implementation; PPO validates the RL implementation
+    # but is slow, so it stays opt-in for a fast CI pass.
+    if args.train:
+        verify_reach_learning(eval_bf16=args.eval_bf16)